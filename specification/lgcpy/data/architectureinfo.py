@@ -234,8 +234,7 @@ class ArchitectureInfos:
         # Fetch the data using a script-relative path
         file_path = self._get_file_path()
 
-        with open(file_path, 'w', encoding='utf-8') as handle:
-            handle.write(self.to_xml_str(pretty_print=True))
+        xu.write_file_if_changed(file_path, self.to_xml_str(pretty_print=True))
 
     def __iter__(self) -> Iterator[ArchitectureInfo]:
         '''
@@ -434,23 +434,24 @@ class CounterInfo():
         assert node.tag == 'CounterInfo'
 
         # Build the core object with the mandatory attributes
-        machine_name = xu.get_node_str(node, 'MachineName')
-        human_name = xu.get_node_str(node, 'HumanName')
-        group_name = xu.get_node_str(node, 'GroupName')
-        group_human_name = xu.get_node_str(node, 'GroupHumanName')
+        texts = xu.get_child_texts(node)
+        machine_name = xu.get_text_str(texts, 'MachineName')
+        human_name = xu.get_text_str(texts, 'HumanName')
+        group_name = xu.get_text_str(texts, 'GroupName')
+        group_human_name = xu.get_text_str(texts, 'GroupHumanName')
 
-        raw_short_desc = xu.get_node_str(node, 'ShortDescription')
+        raw_short_desc = xu.get_text_str(texts, 'ShortDescription')
         short_desc = xu.from_pretty_xml(raw_short_desc, True)
 
-        raw_long_desc = xu.get_node_str(node, 'LongDescription')
+        raw_long_desc = xu.get_text_str(texts, 'LongDescription')
         long_desc = xu.from_pretty_xml(raw_long_desc, True)
 
-        units = xu.get_node_str(node, 'Units')
+        units = xu.get_text_str(texts, 'Units')
 
-        trend_raw = xu.get_node_str(node, 'Trend')
+        trend_raw = xu.get_text_str(texts, 'Trend')
         trend = CounterTrend.from_xml(trend_raw)
 
-        visibility_raw = xu.get_node_str(node, 'Visibility')
+        visibility_raw = xu.get_text_str(texts, 'Visibility')
         visibility = CounterVisibility.from_xml(visibility_raw)
 
         info = cls(source_file, machine_name, human_name,
@@ -461,11 +462,11 @@ class CounterInfo():
         # Assign any non-mandatory attributes piece-wise
 
         # Assign stable ID, if one exists
-        info.stable_id = xu.get_node_opt_int(node, 'StableID')
+        info.stable_id = xu.get_text_opt_int(texts, 'StableID')
 
         # Assign either source_name or equation
-        source_name = xu.get_node_opt_str(node, 'SourceName')
-        raw_equation = xu.get_node_opt_str(node, 'Equation')
+        source_name = xu.get_text_opt_str(texts, 'SourceName')
+        raw_equation = xu.get_text_opt_str(texts, 'Equation')
 
         if source_name:
             assert not raw_equation
@@ -562,8 +563,7 @@ class CounterInfos(list[CounterInfo]):
         '''
         new_files = self.to_xml_str(pretty_print=True)
         for file_path, data in new_files.items():
-            with open(file_path, 'w', encoding='utf-8') as handle:
-                handle.write(data)
+            xu.write_file_if_changed(file_path, data)
 
     def _load_file(self, source_file: str, data: Optional[str] = None) -> None:
         '''
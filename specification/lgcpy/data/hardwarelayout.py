@@ -513,8 +513,7 @@ class HardwareLayouts:
         '''
         new_files = self.to_xml_str(pretty_print=True)
         for file_path, data in new_files.items():
-            with open(file_path, 'w', encoding='utf-8') as handle:
-                handle.write(data)
+            xu.write_file_if_changed(file_path, data)
 
     def _load_file(self, source_file: str, data: Optional[str] = None) -> None:
         '''
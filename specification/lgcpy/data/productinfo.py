@@ -353,33 +353,35 @@ class ProductInfo():
             assert subnode.text is not None
             names.append(subnode.text)
 
-        raw_year = xu.get_node_str(node, 'ReleaseYear')
+        texts = xu.get_child_texts(node)
+
+        raw_year = xu.get_text_str(texts, 'ReleaseYear')
         year = int(raw_year)
 
-        raw_architecture = xu.get_node_str(node, 'Architecture')
+        raw_architecture = xu.get_text_str(texts, 'Architecture')
         architecture = ProductArchitecture.from_xml(raw_architecture)
 
-        raw_visibility = xu.get_node_str(node, 'Visibility')
+        raw_visibility = xu.get_text_str(texts, 'Visibility')
         visibility = ProductVisibility.from_xml(raw_visibility)
 
         # Build the core info object
         info = ProductInfo(ids, names, year, architecture, visibility)
 
         # Optional fields that may not exist
-        raw_string = xu.get_node_opt_str(node, 'EngineeringName')
+        raw_string = xu.get_text_opt_str(texts, 'EngineeringName')
         info.engineering_name = raw_string
 
-        raw_string = xu.get_node_opt_str(node, 'ProjectName')
+        raw_string = xu.get_text_opt_str(texts, 'ProjectName')
         info.project_name = raw_string
 
-        raw_string = xu.get_node_opt_str(node, 'ArchitectureBranch')
+        raw_string = xu.get_text_opt_str(texts, 'ArchitectureBranch')
         info.architecture_branch = raw_string
 
-        raw_string = xu.get_node_opt_str(node, 'DatabaseKey')
+        raw_string = xu.get_text_opt_str(texts, 'DatabaseKey')
         if raw_string:
             info.database_key = raw_string
 
-        raw_string = xu.get_node_opt_str(node, 'DocumentName')
+        raw_string = xu.get_text_opt_str(texts, 'DocumentName')
         if raw_string:
             if raw_string == 'False':
                 info.document_name = None
@@ -60,7 +60,7 @@ XML database source files are ./database/Mali-SemanticSectionInfo.xml and
 from __future__ import annotations
 
 import pathlib
-from typing import Iterator
+from typing import Iterator, Optional
 import xml.dom.minidom as md
 import xml.etree.ElementTree as et
 
@@ -183,27 +183,21 @@ class SemanticGroupInfos:
         self.copyright = copyright_msg
         self.groups: dict[str, list[SemanticGroupInfo]] = {}
 
-    def get_info_for(self, key: str, group: str) -> SemanticGroupInfo:
+    def try_get_info_for(self, key: str,
+                         group: str) -> Optional[SemanticGroupInfo]:
         '''
-        Get the semantic info for a specific GPU.
+        Get the semantic info for a specific GPU, if it exists.
 
         Args:
             key: The canonical database GPU name.
             group: The group name.
 
         Returns:
-            The info object.
-
-        Raises:
-            KeyError if not found.
+            The info object, or None if not found.
         '''
         default = None
 
-        group_list = self.groups.get(group, None)
-        if not group_list:
-            raise KeyError(f'No group for {key}.{group}')
-
-        for info in group_list:
+        for info in self.groups.get(group, ()):
             # Return exact match by preference
             if key in info.gpu_support:
                 return info
@@ -213,11 +207,28 @@ class SemanticGroupInfos:
                 assert not default
                 default = info
 
-        if not default:
-            raise KeyError(f'No default for {key}.{group}')
-
         return default
 
+    def get_info_for(self, key: str, group: str) -> SemanticGroupInfo:
+        '''
+        Get the semantic info for a specific GPU.
+
+        Args:
+            key: The canonical database GPU name.
+            group: The group name.
+
+        Returns:
+            The info object.
+
+        Raises:
+            KeyError if not found.
+        '''
+        info = self.try_get_info_for(key, group)
+        if info is None:
+            raise KeyError(f'No group info for {key}.{group}')
+
+        return info
+
     def to_xml_str(self, pretty_print: bool = False) -> str:
         '''
         Serialize to XML.
@@ -251,8 +262,7 @@ class SemanticGroupInfos:
         # Fetch the data using a script-relative path
         file_path = self._get_file_path()
 
-        with open(file_path, 'w', encoding='utf-8') as handle:
-            handle.write(self.to_xml_str(pretty_print=True))
+        xu.write_file_if_changed(file_path, self.to_xml_str(pretty_print=True))
 
     def __iter__(self) -> Iterator[SemanticGroupInfo]:
         '''
@@ -449,27 +459,21 @@ class SemanticSectionInfos:
         self.copyright = copyright_msg
         self.sections: dict[str, list[SemanticSectionInfo]] = {}
 
-    def get_info_for(self, key: str, section: str) -> SemanticSectionInfo:
+    def try_get_info_for(self, key: str,
+                         section: str) -> Optional[SemanticSectionInfo]:
         '''
-        Get the semantic info for a specific GPU.
+        Get the semantic info for a specific GPU, if it exists.
 
         Args:
             key: The canonical database GPU name.
             section: The section name.
 
         Returns:
-            The info object.
-
-        Raises:
-            KeyError if not found.
+            The info object, or None if not found.
         '''
         default = None
 
-        section_list = self.sections.get(section, None)
-        if not section_list:
-            raise KeyError(f'No section for {key}.{section}')
-
-        for info in section_list:
+        for info in self.sections.get(section, ()):
             # Return exact match by preference
             if key in info.gpu_support:
                 return info
@@ -479,11 +483,28 @@ class SemanticSectionInfos:
                 assert not default, f'Two defaults for {section}'
                 default = info
 
-        if not default:
-            raise KeyError(f'No default for {key}.{section}')
-
         return default
 
+    def get_info_for(self, key: str, section: str) -> SemanticSectionInfo:
+        '''
+        Get the semantic info for a specific GPU.
+
+        Args:
+            key: The canonical database GPU name.
+            section: The section name.
+
+        Returns:
+            The info object.
+
+        Raises:
+            KeyError if not found.
+        '''
+        info = self.try_get_info_for(key, section)
+        if info is None:
+            raise KeyError(f'No section info for {key}.{section}')
+
+        return info
+
     def to_xml_str(self, pretty_print: bool = False) -> str:
         '''
         Serialize to XML.
@@ -517,8 +538,7 @@ class SemanticSectionInfos:
         # Fetch the data using a script-relative path
         file_path = self._get_file_path()
 
-        with open(file_path, 'w', encoding='utf-8') as handle:
-            handle.write(self.to_xml_str(pretty_print=True))
+        xu.write_file_if_changed(file_path, self.to_xml_str(pretty_print=True))
 
     def __iter__(self) -> Iterator[SemanticSectionInfo]:
         '''
@@ -82,6 +82,9 @@ import yaml
 
 from .. import xmlutils as xu
 
+# Use the libyaml parser if PyYAML was built with it
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class SemanticCounterLayout:
     '''
@@ -331,8 +334,7 @@ class SemanticLayout:
         # Fetch the data using a script-relative path
         file_path = self._get_file_path()
 
-        with open(file_path, 'w', encoding='utf-8') as handle:
-            handle.write(self.to_yaml_str())
+        xu.write_file_if_changed(file_path, self.to_yaml_str())
 
     def __iter__(self) -> Iterator[SemanticSectionLayout]:
         '''
@@ -389,7 +391,7 @@ class SemanticLayout:
         '''
         # YAML dicts are not ordered, so we have list of single item dicts
         # storing the hierarchy name and the list of sub-items in them
-        root_hierarchy = yaml.safe_load(document)
+        root_hierarchy = yaml.load(document, Loader=YamlLoader)
 
         copyright_msg = xu.get_copyright_from_yaml_str(document)
 
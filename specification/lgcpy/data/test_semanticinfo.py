@@ -73,6 +73,16 @@ class SemanticGroupInfoTestSuite(unittest.TestCase):
         deserialized = SemanticGroupInfos.from_xml_str(serialized)
         self.assertEqual(deserialized_original, deserialized)
 
+    def test_missing_info(self):
+        '''
+        Test the SemanticGroupInfo lookups for a missing group.
+        '''
+        infos = SemanticGroupInfos.from_file()
+
+        self.assertIsNone(infos.try_get_info_for('Mali-G710', '<missing>'))
+        with self.assertRaises(KeyError):
+            infos.get_info_for('Mali-G710', '<missing>')
+
 
 def main() -> int:
     '''
@@ -33,10 +33,14 @@ CounterDatabase.clear_cache().
 
 from __future__ import annotations
 
+import sys
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
 from .data.architectureinfo import ArchitectureInfos, ArchitectureInfo
 from .data.counterinfo import CounterInfos
 from .data.productinfo import ProductInfos, ProductInfo
-from .data.hardwarelayout import HardwareLayouts
+from .data.hardwarelayout import HardwareLayouts, HardwareLayout
 from .data.semanticinfo import SemanticSectionInfos, SemanticGroupInfos
 from .data.semanticlayout import SemanticLayout
 
@@ -44,34 +48,84 @@ from .view.indexedview import IndexedView
 from .view.hardwareview import HardwareView
 from .view.semanticview import SemanticView
 
+T = TypeVar('T')
+
+
+class _LazyDatabase(Generic[T]):
+    '''
+    Class-level descriptor that loads a component database on first access.
+
+    The loaded database replaces the descriptor on the owning class, so
+    subsequent accesses are plain class attribute reads.
+    '''
+
+    def __init__(self, loader: Callable[[], T]):
+        '''
+        Create a new lazy database descriptor.
+
+        Args:
+            loader: Function to call to load the database from disk.
+        '''
+        self.loader = loader
+        self.name = ''
+        self.owner: Optional[type] = None
+        self.lock = threading.Lock()
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        # Keep the defining class, as subclasses may trigger the first load
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance: object, owner: type) -> T:
+        assert self.owner is not None
+
+        with self.lock:
+            # Another thread may have loaded the value while we waited
+            value = self.owner.__dict__[self.name]
+            if value is not self:
+                return value
+
+            value = self.loader()
+            setattr(self.owner, self.name, value)
+            return value
+
 
 class CounterDatabase:
     '''
     CounterDatabase is a convenience wrapper that exposes simple entrypoints
     to query supported products and create per-product data views.
     '''
-    # Component databases loaded from disk
-    g_architecture_info_db = ArchitectureInfos.from_file()
-    g_counter_info_db = CounterInfos.from_files()
-    g_product_info_db = ProductInfos.from_file()
-    g_hardware_layout_db = HardwareLayouts.from_files()
-    g_semantic_layout_db = SemanticLayout.from_file()
-    g_semantic_section_info_db = SemanticSectionInfos.from_file()
-    g_semantic_group_info_db = SemanticGroupInfos.from_file()
+    # Component databases loaded from disk on first use
+    g_architecture_info_db = _LazyDatabase(ArchitectureInfos.from_file)
+    g_counter_info_db = _LazyDatabase(CounterInfos.from_files)
+    g_product_info_db = _LazyDatabase(ProductInfos.from_file)
+    g_hardware_layout_db = _LazyDatabase(HardwareLayouts.from_files)
+    g_semantic_layout_db = _LazyDatabase(SemanticLayout.from_file)
+    g_semantic_section_info_db = _LazyDatabase(SemanticSectionInfos.from_file)
+    g_semantic_group_info_db = _LazyDatabase(SemanticGroupInfos.from_file)
 
     # Caches for per-product views
     g_iview_db: dict[str, IndexedView] = {}
     g_hview_db: dict[str, HardwareView] = {}
     g_sview_db: dict[str, SemanticView] = {}
 
+    # Lock serializing view construction, re-entrant as views nest
+    g_build_lock = threading.RLock()
+
+    # Caches for per-product lookups
+    g_arch_info_db: dict[str, ArchitectureInfo] = {}
+    g_gpu_set: Optional[frozenset[str]] = None
+
     @classmethod
     def clear_cache(cls) -> None:
         '''
-        Clear all generated database views.
+        Clear all generated database views and cached lookups.
         '''
         cls.g_iview_db.clear()
         cls.g_hview_db.clear()
         cls.g_sview_db.clear()
+        cls.g_arch_info_db.clear()
+        cls.g_gpu_set = None
 
     @classmethod
     def get_indexed_view_for(cls, product_name: str) -> IndexedView:
@@ -85,16 +139,41 @@ class CounterDatabase:
             The created view for the named product.
         '''
         # Cache hit
-        if product_name in cls.g_iview_db:
-            return cls.g_iview_db[product_name]
+        product_name = sys.intern(product_name)
+        view = cls.g_iview_db.get(product_name)
+        if view is not None:
+            return view
 
         # Cache miss
-        pd_info = cls.g_product_info_db.get_gpu(product_name)
-        hl_info = cls.g_hardware_layout_db.get_gpu(pd_info.database_key)
+        with cls.g_build_lock:
+            # Another thread may have built the view while we waited
+            view = cls.g_iview_db.get(product_name)
+            if view is not None:
+                return view
+
+            pd_info = cls.g_product_info_db.get_gpu(product_name)
+            hl_info = cls.g_hardware_layout_db.get_gpu(pd_info.database_key)
+
+            return cls._build_indexed_view(product_name, pd_info, hl_info)
+
+    @classmethod
+    def _build_indexed_view(cls, product_name: str, pd_info: ProductInfo,
+                            hl_info: HardwareLayout) -> IndexedView:
+        '''
+        Build and cache the indexed view for a specific GPU.
 
+        Caller must hold the build lock.
+
+        Args:
+            product_name: GPU to load, can be an alias.
+            pd_info: The product info for the named product.
+            hl_info: The hardware layout for the named product.
+
+        Returns:
+            The created view for the named product.
+        '''
         view = IndexedView.from_db(
             product_name, pd_info, hl_info, cls.g_counter_info_db)
-        view.resolve_equations()
 
         # Cache insert
         cls.g_iview_db[product_name] = view
@@ -113,21 +192,32 @@ class CounterDatabase:
             The created view for the named product.
         '''
         # Cache hit
-        if product_name in cls.g_hview_db:
-            return cls.g_hview_db[product_name]
+        product_name = sys.intern(product_name)
+        view = cls.g_hview_db.get(product_name)
+        if view is not None:
+            return view
 
-        # Cache miss
-        pd_info = cls.g_product_info_db.get_gpu(product_name)
-        i_view = cls.get_indexed_view_for(product_name)
+        # Cache miss, reusing the lookups for the indexed view if needed
+        with cls.g_build_lock:
+            # Another thread may have built the view while we waited
+            view = cls.g_hview_db.get(product_name)
+            if view is not None:
+                return view
 
-        hl_info = cls.g_hardware_layout_db.get_gpu(pd_info.database_key)
+            pd_info = cls.g_product_info_db.get_gpu(product_name)
+            hl_info = cls.g_hardware_layout_db.get_gpu(pd_info.database_key)
 
-        view = HardwareView.from_db(hl_info, i_view)
+            i_view = cls.g_iview_db.get(product_name)
+            if i_view is None:
+                i_view = cls._build_indexed_view(
+                    product_name, pd_info, hl_info)
 
-        # Cache insert
-        cls.g_hview_db[product_name] = view
+            view = HardwareView.from_db(hl_info, i_view)
 
-        return view
+            # Cache insert
+            cls.g_hview_db[product_name] = view
+
+            return view
 
     @classmethod
     def get_semantic_view_for(cls, name: str) -> SemanticView:
@@ -141,24 +231,64 @@ class CounterDatabase:
             The created view for the named product.
         '''
         # Cache hit
-        if name in cls.g_sview_db:
-            return cls.g_sview_db[name]
+        name = sys.intern(name)
+        view = cls.g_sview_db.get(name)
+        if view is not None:
+            return view
+
+        # Cache miss, reusing the lookups for the indexed view if needed
+        with cls.g_build_lock:
+            # Another thread may have built the view while we waited
+            view = cls.g_sview_db.get(name)
+            if view is not None:
+                return view
+
+            pd_info = cls.g_product_info_db.get_gpu(name)
+            key = pd_info.database_key
+
+            i_view = cls.g_iview_db.get(name)
+            if i_view is None:
+                hl_info = cls.g_hardware_layout_db.get_gpu(key)
+                i_view = cls._build_indexed_view(name, pd_info, hl_info)
+
+            view = SemanticView.from_db(
+                key,
+                cls.g_semantic_layout_db,
+                cls.g_semantic_section_info_db,
+                cls.g_semantic_group_info_db,
+                i_view)
+
+            # Cache insert
+            cls.g_sview_db[name] = view
+
+            return view
 
-        # Cache miss
-        i_view = cls.get_indexed_view_for(name)
-        pd_info = cls.g_product_info_db.get_gpu(name)
+    @classmethod
+    def prewarm_views(cls,
+                      background: bool = False) -> Optional[threading.Thread]:
+        '''
+        Build the indexed views for all supported GPUs ahead of use.
 
-        view = SemanticView.from_db(
-            pd_info.database_key,
-            cls.g_semantic_layout_db,
-            cls.g_semantic_section_info_db,
-            cls.g_semantic_group_info_db,
-            i_view)
+        Tools that iterate all GPUs can call this to front-load view
+        construction, optionally overlapping it with other setup work.
 
-        # Cache insert
-        cls.g_sview_db[name] = view
+        Args:
+            background: True to build the views in a daemon thread.
 
-        return view
+        Returns:
+            The started thread if building in the background, else None.
+        '''
+        def prewarm():
+            for gpu in cls.get_supported_gpus():
+                cls.get_indexed_view_for(gpu)
+
+        if not background:
+            prewarm()
+            return None
+
+        thread = threading.Thread(target=prewarm, daemon=True)
+        thread.start()
+        return thread
 
     @classmethod
     def get_supported_gpus(cls) -> list[str]:
@@ -172,6 +302,23 @@ class CounterDatabase:
         '''
         return cls.g_product_info_db.get_gpus()
 
+    @classmethod
+    def get_supported_gpus_set(cls) -> frozenset[str]:
+        '''
+        Get the set of all available GPUs.
+
+        This is the same set of names as get_supported_gpus(), but is cached
+        and suitable for fast membership tests.
+
+        Returns:
+            Set of all GPUs available in the database, including product
+            aliases.
+        '''
+        if cls.g_gpu_set is None:
+            cls.g_gpu_set = frozenset(cls.g_product_info_db.get_gpus())
+
+        return cls.g_gpu_set
+
     @classmethod
     def get_supported_database_keys(cls) -> list[str]:
         '''
@@ -188,12 +335,9 @@ class CounterDatabase:
         Returns:
             List of all supported database keys.
         '''
-        keys = []
-        for product in cls.g_product_info_db:
-            if product.database_key not in keys:
-                keys.append(product.database_key)
-
-        return keys
+        # Use dict keys as an insertion-ordered set
+        keys = dict.fromkeys(x.database_key for x in cls.g_product_info_db)
+        return list(keys)
 
     @classmethod
     def get_architecture_info_for(cls, product_name: str) -> ArchitectureInfo:
@@ -209,11 +353,20 @@ class CounterDatabase:
         Raises:
             KeyError if not known.
         '''
-        product = cls.get_product_info_for(product_name)
+        # Cache hit
+        if product_name in cls.g_arch_info_db:
+            return cls.g_arch_info_db[product_name]
 
-        return cls.g_architecture_info_db.get_info_for(
+        # Cache miss
+        product = cls.get_product_info_for(product_name)
+        info = cls.g_architecture_info_db.get_info_for(
             product.database_key, product.architecture)
 
+        # Cache insert
+        cls.g_arch_info_db[product_name] = info
+
+        return info
+
     @classmethod
     def get_product_infos(cls) -> ProductInfos:
         '''
@@ -27,87 +27,160 @@ sections in the database, and when building user-visible documentation from the
 machine readable specification.
 '''
 
+import functools
 import re
+import threading
+from typing import Callable, Iterable
 
 import markdown
 
 from .database import CounterDatabase
+from .view.counterview import CounterView
 from .view.indexedview import IndexedView
 from . import equationutils as eu
 from . import xmlutils as xu
 
 
-def resolve_doc_to_text(document: str, index_view: IndexedView) -> str:
-    '''
-    Resolve all symbolic references in a document entry to text values.
+# Reusable Markdown converters, one per thread as conversion is stateful
+g_markdown = threading.local()
 
-    This function replaces all symbolic references in a database document
-    entry with the appropriate string for the current product. Supported
-    symbolic references are:
+# Pattern to find symbolic references in a document
+REFERENCE_PATTERN = re.compile(r'{{(.*?)}}')
 
-    -  {{K:GPU_NAME}}: Insert GPU product name.
-    -  {{C:<MachineName>}}: Insert human name of <MachineName> counter.
-    -  {{C:<MachineName>.equation}}: Insert equation of <MachineName> counter.
+# Pattern to split a symbolic reference into its component parts
+REFERENCE_PARTS_PATTERN = re.compile(
+    r'^(?P<type>[CK])::(?P<name>[^.]+)(?:\.(?P<part>equation))?$')
+
+# Callable to render a counter reference, given a counter and reference part
+CounterRenderer = Callable[[CounterView, str], str]
 
-    It is likely that web-based documentation may want something more nuanced,
-    such as also injecting hyperlinks to cross-reference counters, but this
-    is a good reference implementation for more advanced use.
+
+def _make_resolver(index_view: IndexedView,
+                   render_counter: CounterRenderer) -> Callable[[str], str]:
+    '''
+    Create a callable that resolves all symbolic references in a document.
+
+    The returned resolver memoizes each unique reference, so reusing one
+    resolver for many documents amortizes the lookup and render costs.
 
     Args:
-        document: The description to resolve.
         index_view: The view for the current GPU we can use to find references.
+        render_counter: Callable to render a resolved counter reference.
 
     Returns:
-        Resolved string.
+        Callable taking a document and returning the resolved string.
     '''
     product = CounterDatabase.get_product_info_for(index_view.gpu)
+    gpu_name = product.get_document_name(allow_indirect=True)
+    by_machine_name = index_view.by_machine_name
+
+    # Cache of resolved references
+    resolved: dict[str, str] = {}
+
+    # Callable to resolve a single reference
+    def resolve(pattern):
+        # Validate reference pattern is legal, the pattern only matches
+        # the legal reference types and parts
+        parts = REFERENCE_PARTS_PATTERN.match(pattern)
+        if not parts:
+            raise ValueError(f'Bad reference {pattern}')
+
+        ref_type = parts['type']
+        ref_name = parts['name']
+
+        # Counter reference
+        if ref_type == 'C':
+            counter = by_machine_name[ref_name.lower()]
+            return render_counter(counter, parts['part'] or '')
+
+        # Literal constant reference
+        if ref_name == 'GPU_NAME':
+            return gpu_name
+
+        raise ValueError(f'Bad constant reference {pattern}')
 
     # Callable to replace any counter references in the description text
     def replace(match):
         pattern = match.group(1)
+        if pattern not in resolved:
+            resolved[pattern] = resolve(pattern)
+        return resolved[pattern]
 
-        # Validate reference pattern is legal
-        ref_type, _, reference = pattern.partition('::')
-        assert ref_type in ('C', 'K'), f'Bad reference type {pattern}'
+    def resolver(document):
+        return REFERENCE_PATTERN.sub(replace, document)
 
-        ref_name, _, ref_part = reference.partition('.')
-        assert ref_part in ('', 'equation'), f'Bad reference part {pattern}'
+    return resolver
 
-        # Literal constant reference
-        if ref_type == 'K':
-            if ref_name == 'GPU_NAME':
-                return product.get_document_name(allow_indirect=True)
 
-        # Counter reference
-        elif ref_type == 'C':
-            counter = index_view.get_by_machine_name(ref_name)
+def _get_resolver(index_view: IndexedView,
+                  render_counter: CounterRenderer) -> Callable[[str], str]:
+    '''
+    Get the shared resolver for a view, creating it on first use.
 
-            # No postfix returns the human name
-            if ref_part == '':
-                return counter.human_name
+    Sharing one resolver per view and renderer means that each unique
+    reference is only resolved once, however many documents use it.
 
-            # Equation postfix returns the equation value
-            if ref_part == 'equation':
-                expression = eu.equation_ast_to_string(counter.equation_ast)
-                return str(expression)
+    Args:
+        index_view: The view for the current GPU we can use to find references.
+        render_counter: Callable to render a resolved counter reference.
 
-        # Should never reach this ...
-        assert False
+    Returns:
+        Callable taking a document and returning the resolved string.
+    '''
+    cache = index_view.resolver_cache
+    resolver = cache.get(render_counter)
+    if resolver is None:
+        resolver = _make_resolver(index_view, render_counter)
+        cache[render_counter] = resolver
 
-    return re.sub(r'{{(.*?)}}', replace, document, 0)
+    return resolver
 
 
-def resolve_doc_to_hyperlink(document: str, index_view: IndexedView) -> str:
+def _render_counter_text(counter: CounterView, ref_part: str) -> str:
     '''
-    Resolve all symbolic references in a document entry.
+    Render a counter reference as plain text.
+
+    Args:
+        counter: The referenced counter.
+        ref_part: The reference part, or empty string if none.
+
+    Returns:
+        Rendered string.
+    '''
+    # No postfix returns the human name
+    if ref_part == '':
+        return counter.human_name
+
+    # Equation postfix returns the equation value
+    return str(eu.equation_ast_to_string(counter.equation_ast))
+
+
+def _render_counter_hyperlink(counter: CounterView, ref_part: str) -> str:
+    '''
+    Render a counter reference as a hyperlink to the counter documentation.
+
+    Args:
+        counter: The referenced counter.
+        ref_part: The reference part, or empty string if none.
+
+    Returns:
+        Rendered string.
+    '''
+    label = _render_counter_text(counter, ref_part)
+    return f'<a href="#{counter.get_anchor()}">{label}</a>'
+
+
+def resolve_doc_to_text(document: str, index_view: IndexedView) -> str:
+    '''
+    Resolve all symbolic references in a document entry to text values.
 
     This function replaces all symbolic references in a database document
     entry with the appropriate string for the current product. Supported
     symbolic references are:
 
-    -  {{K:GPU_NAME}}: Insert GPU product name.
-    -  {{C:<MachineName>}}: Insert human name of <MachineName> counter.
-    -  {{C:<MachineName>.equation}}: Insert equation of <MachineName> counter.
+    -  {{K::GPU_NAME}}: Insert GPU product name.
+    -  {{C::<MachineName>}}: Insert human name of <MachineName> counter.
+    -  {{C::<MachineName>.equation}}: Insert equation of <MachineName> counter.
 
     It is likely that web-based documentation may want something more nuanced,
     such as also injecting hyperlinks to cross-reference counters, but this
@@ -120,47 +193,51 @@ def resolve_doc_to_hyperlink(document: str, index_view: IndexedView) -> str:
     Returns:
         Resolved string.
     '''
-    product = CounterDatabase.get_product_info_for(index_view.gpu)
+    return _get_resolver(index_view, _render_counter_text)(document)
 
-    # Callable to replace any counter references in the description text
-    def replace(match):
-        pattern = match.group(1)
 
-        # Validate reference pattern is legal
-        ref_type, _, reference = pattern.partition('::')
-        assert ref_type in ('C', 'K'), f'Bad reference type {pattern}'
+def resolve_doc_to_hyperlink(document: str, index_view: IndexedView) -> str:
+    '''
+    Resolve all symbolic references in a document entry.
+
+    This function replaces all symbolic references in a database document
+    entry with the appropriate string for the current product. Counter
+    references are emitted as HTML hyperlinks to the counter anchor. Supported
+    symbolic references are:
 
-        ref_name, _, ref_part = reference.partition('.')
-        assert ref_part in ('', 'equation'), f'Bad reference part {pattern}'
+    -  {{K::GPU_NAME}}: Insert GPU product name.
+    -  {{C::<MachineName>}}: Insert human name of <MachineName> counter.
+    -  {{C::<MachineName>.equation}}: Insert equation of <MachineName> counter.
 
-        # Literal constant reference
-        if ref_type == 'K':
-            if ref_name == 'GPU_NAME':
-                return product.get_document_name(allow_indirect=True)
+    Args:
+        document: The description to resolve.
+        index_view: The view for the current GPU we can use to find references.
 
-        # Counter reference
-        elif ref_type == 'C':
-            counter = index_view.get_by_machine_name(ref_name)
+    Returns:
+        Resolved string.
+    '''
+    return _get_resolver(index_view, _render_counter_hyperlink)(document)
 
-            # No postfix returns the human name
-            if ref_part == '':
-                label = counter.human_name
-                link = f'<a href="#{counter.get_anchor()}">{label}</a>'
-                return link
 
-            # Equation postfix returns the equation value
-            if ref_part == 'equation':
-                label = eu.equation_ast_to_string(counter.equation_ast)
-                link = f'<a href="#{counter.get_anchor()}">{label}</a>'
-                return link
+def resolve_docs(documents: Iterable[str], index_view: IndexedView,
+                 hyperlink: bool = False) -> list[str]:
+    '''
+    Resolve all symbolic references in a batch of document entries.
 
-            # Should never reach this ...
-            assert False
+    This is equivalent to calling resolve_doc_to_text(), or
+    resolve_doc_to_hyperlink(), for each document in turn.
 
-        # Should never reach this ...
-        assert False
+    Args:
+        documents: The descriptions to resolve.
+        index_view: The view for the current GPU we can use to find references.
+        hyperlink: True to emit counter references as hyperlinks.
 
-    return re.sub(r'{{(.*?)}}', replace, document, 0)
+    Returns:
+        Resolved strings, in the same order as the input documents.
+    '''
+    render = _render_counter_hyperlink if hyperlink else _render_counter_text
+    resolver = _get_resolver(index_view, render)
+    return [resolver(x) for x in documents]
 
 
 def to_markdown_string(document: str) -> str:
@@ -176,14 +253,24 @@ def to_markdown_string(document: str) -> str:
     return xu.to_pretty_xml(document, True, 0, 0, 79)
 
 
+@functools.lru_cache(maxsize=4096)
 def to_html_string(document: str) -> str:
     '''
     Format a long description as an HTML string.
 
+    This is safe to call from multiple threads, as each thread uses its own
+    Markdown converter.
+
     Args:
         document: The description to format.
 
     Returns:
         The formatted string.
     '''
-    return markdown.markdown(xu.to_pretty_xml(document, True, 0, 0, 79))
+    converter = getattr(g_markdown, 'converter', None)
+    if converter is None:
+        converter = markdown.Markdown()
+        g_markdown.converter = converter
+
+    return converter.reset().convert(
+        xu.to_pretty_xml(document, True, 0, 0, 79))
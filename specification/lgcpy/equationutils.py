@@ -41,8 +41,10 @@ Available functionality includes:
 '''
 from __future__ import annotations
 
+import functools
 import pathlib
 import re
+from string import ascii_uppercase, digits
 from typing import Any, Optional, TYPE_CHECKING
 
 from lark.exceptions import LarkError, VisitError
@@ -53,9 +55,23 @@ if TYPE_CHECKING:
     from .view.indexedview import IndexedView
 
 
-# Pattern for matching constant variable names, which can consist of only upper
-# case, numbers, and underscores.
-CONSTANT_PATTERN = re.compile('^[A-Z0-9_]+$')
+# Translation table deleting the characters allowed in constant variable names,
+# which can consist of only upper case, numbers, and underscores.
+CONSTANT_CHARS = str.maketrans('', '', ascii_uppercase + digits + '_')
+
+
+# Pattern for matching runs of characters that Streamline does not allow in
+# variable names.
+STREAMLINE_WORD_SEPARATOR = re.compile(r'[^_A-Za-z0-9]+')
+
+
+# Map of constant names to the equivalent Streamline constant expression.
+STREAMLINE_CONSTANTS = {
+    'MALI_CONFIG_TIME_SPAN': '$ZOOM',
+    'MALI_CONFIG_L2_CACHE_COUNT': '$MaliConstantsL2SliceCount',
+    'MALI_CONFIG_SHADER_CORE_COUNT': '$MaliConstantsShaderCoreCount',
+    'MALI_CONFIG_EXT_BUS_BYTE_SIZE': '($MaliConstantsBusWidthBits / 8)'
+}
 
 
 def _load_grammar() -> Lark:
@@ -68,7 +84,9 @@ def _load_grammar() -> Lark:
     with open(file_path, 'r', encoding='utf-8') as handle:
         grammar = handle.read()
 
-    parser = Lark(grammar, ambiguity='explicit')
+    # The grammar is unambiguous and LALR(1) compatible, so use the much
+    # faster LALR parser rather than the default Earley parser
+    parser = Lark(grammar, parser='lalr')
     return parser
 
 
@@ -76,6 +94,36 @@ def _load_grammar() -> Lark:
 g_parser = _load_grammar()
 
 
+def is_constant_name(name: str) -> bool:
+    '''
+    Utility function to test if a variable name is a constant name.
+
+    Returns:
+        True if a constant name, False otherwise.
+    '''
+    return bool(name) and not name.translate(CONSTANT_CHARS)
+
+
+def to_number(value) -> Optional[float]:
+    '''
+    Utility function to convert a string to a number.
+
+    Returns:
+        The numeric value, or None if not numeric.
+    '''
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    # Only strings can be literals, anything else is an expression node
+    if not isinstance(value, str):
+        return None
+
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
 def is_number(value) -> bool:
     '''
     Utility function to test if a string is a number.
@@ -83,11 +131,7 @@ def is_number(value) -> bool:
     Returns:
         True if numeric, False otherwise.
     '''
-    try:
-        float(str(value))
-        return True
-    except ValueError:
-        return False
+    return to_number(value) is not None
 
 
 def to_literal(value: float) -> str:
@@ -98,13 +142,10 @@ def to_literal(value: float) -> str:
         String value, which will be formatted as an integer if value can be
         represented losslessly as an integer, else formatted as a float.
     '''
-    int_str = str(int(value))
-    int_test = float(int_str)
+    if float(value).is_integer():
+        return str(int(value))
 
-    if value == int_test:
-        return int_str
-
-    return str(float)
+    return str(float(value))
 
 
 class EquationError(BaseException):
@@ -137,9 +178,11 @@ class FunctionNode:
 
     Attributes:
         function: The name of the function in this node
-        string: The string form of the equation in this node.
+        params: The function parameter subexpressions.
     '''
 
+    __slots__ = ('function', 'params', '_string')
+
     def __init__(self, function: str, *params):
         '''
         Create a new equation node.
@@ -149,7 +192,19 @@ class FunctionNode:
             params: List of function parameter subexpressions.
         '''
         self.function = function
-        self.string = f'{function}({", ".join(str(x) for x in params)})'
+        self.params = params
+        self._string: Optional[str] = None
+
+    @property
+    def string(self) -> str:
+        '''
+        The string form of the equation in this node, built on first use.
+        '''
+        if self._string is None:
+            params = ', '.join(str(x) for x in self.params)
+            self._string = f'{self.function}({params})'
+
+        return self._string
 
     def __str__(self):
         return self.string
@@ -163,11 +218,14 @@ class OperatorNode:
     subexpressions or simple values.
 
     Attributes:
+        op_a: The first operand.
         operator: The operator of this node.
+        op_b: The second operand.
         precedence: The precedence of the operator in this node.
-        string: The string form of the equation in this node.
     '''
 
+    __slots__ = ('op_a', 'operator', 'op_b', 'precedence', '_string')
+
     def __init__(self, op_a: str, operator: str, op_b: str, precedence: int):
         '''
         Create a new equation node.
@@ -180,10 +238,21 @@ class OperatorNode:
         '''
         self.operator = operator
         self.precedence = precedence
-        self.op_a = self.add_parens(op_a)
-        self.op_b = self.add_parens(op_b)
+        self.op_a = op_a
+        self.op_b = op_b
+        self._string: Optional[str] = None
+
+    @property
+    def string(self) -> str:
+        '''
+        The string form of the equation in this node, built on first use.
+        '''
+        if self._string is None:
+            op_a = self.add_parens(self.op_a)
+            op_b = self.add_parens(self.op_b)
+            self._string = f'{op_a} {self.operator} {op_b}'
 
-        self.string = f'{self.op_a} {operator} {self.op_b}'
+        return self._string
 
     def add_parens(self, operand):
         '''
@@ -290,17 +359,15 @@ class EquationPrettyPrintTransformer(Transformer):
         Returns:
             Returns None if did not optimize, the mul rewrite otherwise.
         '''
-        # Invalid types for this function
-        if not isinstance(operand_a, str) or not isinstance(operand_b, str):
+        # Invalid types or values for this function
+        num_a = to_number(operand_a)
+        if num_a is None:
             return None
 
-        # Invalid values for this function
-        if not is_number(operand_a) or not is_number(operand_b):
+        num_b = to_number(operand_b)
+        if num_b is None:
             return None
 
-        num_a = float(operand_a)
-        num_b = float(operand_b)
-
         # A * B => value(A * B)
         if operator == '*':
             return to_literal(num_a * num_b)
@@ -321,16 +388,17 @@ class EquationPrettyPrintTransformer(Transformer):
             Returns None if did not optimize, the mul rewrite otherwise.
         '''
         # Invalid types for this function
-        if not isinstance(operand_a, OperatorNode) or \
-           not isinstance(operand_b, str):
+        if not isinstance(operand_a, OperatorNode):
             return None
 
         # Invalid values for this function
-        if not is_number(operand_a.op_b) or not is_number(operand_b):
+        num_b = to_number(operand_b)
+        if num_b is None:
             return None
 
-        num_a = float(operand_a.op_b)
-        num_b = float(operand_b)
+        num_a = to_number(operand_a.op_b)
+        if num_a is None:
+            return None
 
         # (Aa * Ab) * B => Aa * value(Ab * B)
         if operand_a.operator == '*' and operator == '*':
@@ -393,7 +461,7 @@ class EquationResolveTransformer(Transformer):
         Variable name grammar token rewrite.
         '''
         # For constants, just return the macro name directly
-        if CONSTANT_PATTERN.match(args):
+        if is_constant_name(args):
             return args
 
         # For counters, fetch the metadata
@@ -401,12 +469,18 @@ class EquationResolveTransformer(Transformer):
         assert counter is not None, f'Missing counter: {args}'
 
         # Hardware counters don't need tree resolve so return name directly
-        if not counter.is_derived():
+        if not counter.derived:
             return args
 
-        # Derived counters need tree resolve so recursively resolve ...
-        transformer = EquationResolveTransformer(self.index_view)
-        return transformer.transform(counter.equation_ast)
+        # Derived counters need tree resolve so recursively resolve, reusing
+        # any earlier resolve of the same counter in this view ...
+        cache = self.index_view.resolve_cache
+        resolved = cache.get(counter.machine_name)
+        if resolved is None:
+            resolved = self.transform(counter.equation_ast)
+            cache[counter.machine_name] = resolved
+
+        return resolved
 
 
 class EquationHardwareTransformer(Transformer):
@@ -455,8 +529,6 @@ class EquationStreamlineTransformer(Transformer):
     regenerated from the same version of the database.
     '''
 
-    CONSTANT_PATTERN = re.compile('^[A-Z0-9_]+$')
-
     def __init__(self, index_view: IndexedView):
         '''
         Create a new equation rename transformer.
@@ -472,12 +544,12 @@ class EquationStreamlineTransformer(Transformer):
         '''
         Variable name grammar token rewrite.
         '''
-        if self.CONSTANT_PATTERN.match(args):
+        if is_constant_name(args):
             return self.mangle_constant_name(args)
 
         counter = self.index_view.get_by_machine_name(args)
         assert counter
-        return self.mangle_variable_name(counter)
+        return counter.streamline_name
 
     @staticmethod
     def mangle_variable_name(counter: CounterView) -> str:
@@ -490,22 +562,14 @@ class EquationStreamlineTransformer(Transformer):
         Returns:
             The Streamline variable name.
         '''
-        assert not counter.is_derived()
+        assert not counter.derived
 
-        parts = []
         full_name = f'{counter.group_name} {counter.group_human_name}'
 
-        # Split words based on things Streamline lets us keep
-        for part in re.split(r'[^_A-Za-z0-9]+', full_name):
-            if not part:
-                continue
-
-            # Upper case first letter of each word
-            part_list = list(part)
-            part_list[0] = part_list[0].upper()
-            parts.append(''.join(part_list))
-
-        new_name = ''.join(parts)
+        # Split words based on things Streamline lets us keep, and upper case
+        # the first letter of each word
+        parts = STREAMLINE_WORD_SEPARATOR.split(full_name)
+        new_name = ''.join(x[:1].upper() + x[1:] for x in parts)
 
         # Clean up prefixes if a number
         if new_name[0] in '0123456789':
@@ -524,15 +588,52 @@ class EquationStreamlineTransformer(Transformer):
         Returns:
             The Streamline constant name or expression.
         '''
+        return STREAMLINE_CONSTANTS[counter]
+
+
+class EquationHardwarePrettyPrintTransformer(
+        EquationHardwareTransformer, EquationPrettyPrintTransformer):
+    '''
+    Lark transformer to rename all counter machine names in an AST with the
+    equivalent hardware layout name, and generate a pretty-printed equation
+    string, in a single pass.
+    '''
+
+
+class EquationStreamlinePrettyPrintTransformer(
+        EquationStreamlineTransformer, EquationPrettyPrintTransformer):
+    '''
+    Lark transformer to rename all counter machine names in an AST with the
+    equivalent Streamline name, and generate a pretty-printed equation
+    string, in a single pass.
+    '''
+
+
+# Shared pretty-printer, which is safe to reuse as it holds no state
+g_pretty_printer = EquationPrettyPrintTransformer()
 
-        counter_names = {
-            'MALI_CONFIG_TIME_SPAN': '$ZOOM',
-            'MALI_CONFIG_L2_CACHE_COUNT': '$MaliConstantsL2SliceCount',
-            'MALI_CONFIG_SHADER_CORE_COUNT': '$MaliConstantsShaderCoreCount',
-            'MALI_CONFIG_EXT_BUS_BYTE_SIZE': '($MaliConstantsBusWidthBits / 8)'
-        }
 
-        return counter_names[counter]
+def _get_view_transformer(transformer_type: type, index_view: IndexedView):
+    '''
+    Get the shared instance of a view-specific transformer.
+
+    Transformers only hold a reference to their view, so one instance of each
+    type can be reused for all equations in that view.
+
+    Args:
+        transformer_type: The transformer class.
+        index_view: The compiled index view for this GPU.
+
+    Returns:
+        The transformer instance.
+    '''
+    cache = index_view.transformer_cache
+    transformer = cache.get(transformer_type)
+    if transformer is None:
+        transformer = transformer_type(index_view)
+        cache[transformer_type] = transformer
+
+    return transformer
 
 
 def get_machine_name_expression(
@@ -553,8 +654,7 @@ def get_machine_name_expression(
     assert counter.equation_ast_resolved
 
     # Pretty print the output
-    transformer = EquationPrettyPrintTransformer()
-    ast = transformer.transform(counter.equation_ast_resolved)
+    ast = g_pretty_printer.transform(counter.equation_ast_resolved)
     equation = str(ast)
 
     # Percentages are clamped between 0 and 100 in the visualization, as
@@ -579,13 +679,10 @@ def get_source_name_expression(
     '''
     assert counter.equation_ast_resolved
 
-    # Generate Hardware AST
-    transformer = EquationHardwareTransformer(index_view)
+    # Rename to hardware names and pretty print the output
+    transformer = _get_view_transformer(
+        EquationHardwarePrettyPrintTransformer, index_view)
     ast = transformer.transform(counter.equation_ast_resolved)
-
-    # Pretty print the output
-    transformer2 = EquationPrettyPrintTransformer()
-    ast = transformer2.transform(ast)
     equation = str(ast)
 
     # Percentages are clamped between 0 and 100 in the visualization, as
@@ -608,18 +705,15 @@ def get_streamline_expression(
     Return:
         The pretty-printed string using Streamline names.
     '''
-    if not counter.is_derived():
+    if not counter.derived:
         ast = equation_string_to_ast(counter.machine_name)[0]
     else:
         ast = counter.equation_ast_resolved
 
-    # Generate Streamline AST
-    transformer = EquationStreamlineTransformer(index_view)
+    # Rename to Streamline names and pretty print the output
+    transformer = _get_view_transformer(
+        EquationStreamlinePrettyPrintTransformer, index_view)
     ast = transformer.transform(ast)
-
-    # Pretty print the output
-    transformer2 = EquationPrettyPrintTransformer()
-    ast = transformer2.transform(ast)
     equation = str(ast)
 
     # Percentages are clamped between 0 and 100 in the visualization, as
@@ -630,10 +724,14 @@ def get_streamline_expression(
     return equation
 
 
+@functools.lru_cache(maxsize=4096)
 def equation_string_to_ast(string: str) -> tuple[Any, Optional[str]]:
     '''
     Convert an equation string into a parsed Lark AST.
 
+    Results are cached, so the returned AST may be shared with other callers
+    and must not be modified in place.
+
     Args:
         string: The equation in string form.
 
@@ -656,8 +754,7 @@ def equation_ast_to_string(ast: Any) -> str:
     Returns:
         The equation in string form.
     '''
-    transformer = EquationPrettyPrintTransformer()
-    return transformer.transform(ast)
+    return g_pretty_printer.transform(ast)
 
 
 def equation_ast_to_resolved_ast(
@@ -675,7 +772,8 @@ def equation_ast_to_resolved_ast(
         present.
     '''
     try:
-        transformer = EquationResolveTransformer(index_view)
+        transformer = _get_view_transformer(
+            EquationResolveTransformer, index_view)
         resolved = transformer.transform(ast)
         return (resolved, None)
 
@@ -24,21 +24,49 @@
 '''
 This module contains utilities we use when processing Arm GPU names.
 '''
+import functools
 import re
 
-# Bifrost, Valhall, and early 5th Generation architecture - e.g. Mali-G77.
-_GPU_GROUP_0 = re.compile(r'^(Mali|Immortalis)-G(\d+)$')
-
-# Later 5th Generation names excluding postfix - e.g. Mali G1.
-_GPU_GROUP_1 = re.compile(r'^Mali G(\d+)$')
+# GPU name pattern, with one alternative per naming scheme. Alternatives are
+# tested in order, so earlier schemes take priority over later ones.
+_GPU_NAME = re.compile(
+    # Bifrost, Valhall, and early 5th Generation architecture - e.g. Mali-G77.
+    r'^(?:(?P<g0_brand>Mali|Immortalis)-G(?P<g0_product>\d+)'
+    # Later 5th Generation names excluding postfix - e.g. Mali G1.
+    r'|Mali G(?P<g1_product>\d+)'
+    # Later 5th Generation names including postfix - e.g. Mali G1-Ultra.
+    r'|Mali G(?P<g2_product>\d+)-(?P<g2_tier>\S+)'
+    # Internal Arm codenames which use non-numeric identifiers e.g. Mali GAAx.
+    r'|Mali (?P<g3_code>\S+))$')
+
+_GROUP0_SUBPRODUCTS = {
+    'Mali': 0,
+    'Immortalis': 1,
+}
+
+_GROUP2_SUBPRODUCTS = {
+    'Pro': 0,
+    'Premium': 1,
+    'Ultra': 2
+}
+
+
+def _codename_weight(code: bytes) -> int:
+    '''
+    Convert a non-numeric GPU codename into a sortable integer.
 
-# Later 5th Generation names including postfix - e.g. Mali G1-Ultra.
-_GPU_GROUP_2 = re.compile(r'^Mali G(\d+)-(\S+)$')
+    Args:
+        code: The codename characters.
 
-# Internal Arm codenames which use non-numeric identifiers e.g. Mali GAAx.
-_GPU_GROUP_3 = re.compile(r'^Mali (\S+)$')
+    Returns:
+        Sortable weight, ordered by character with earlier characters being
+        more significant.
+    '''
+    plen = len(code)
+    return sum((plen - i) * 256 * x for i, x in enumerate(code))
 
 
+@functools.lru_cache(maxsize=256)
 def _sort_gpu_code(product_name: str) -> tuple[int, int, int, str]:
     '''
     Convert a GPU name into a sortable tuple.
@@ -51,45 +79,29 @@ def _sort_gpu_code(product_name: str) -> tuple[int, int, int, str]:
         subproduct are integers, allowing a list of tuples to be sorted, and
         then name to be recovered in presentation-order.
     '''
-    if match := _GPU_GROUP_0.match(product_name):
-        group = 0
-        product = int(match.group(2))
-
-        group0_subproducts = {
-            'Mali': 0,
-            'Immortalis': 1,
-        }
+    match = _GPU_NAME.match(product_name)
+    assert match, f'Unknown GPU name {product_name}'
 
-        subproduct = group0_subproducts[match.group(1)]
+    if value := match['g0_product']:
+        group = 0
+        product = int(value)
+        subproduct = _GROUP0_SUBPRODUCTS[match['g0_brand']]
 
-    elif match := _GPU_GROUP_1.match(product_name):
+    elif value := match['g1_product']:
         group = 1
-        product = int(match.group(1))
+        product = int(value)
         subproduct = 0
 
-    elif match := _GPU_GROUP_2.match(product_name):
+    elif value := match['g2_product']:
         group = 2
-        product = int(match.group(1))
-
-        group2_subproducts = {
-            'Pro': 0,
-            'Premium': 1,
-            'Ultra': 2
-        }
-
-        subproduct = group2_subproducts[match.group(2)]
+        product = int(value)
+        subproduct = _GROUP2_SUBPRODUCTS[match['g2_tier']]
 
-    elif match := _GPU_GROUP_3.match(product_name):
+    else:
         group = 3
-        plen = len(match.group(1))
-        parts = [(plen - i) * 256 * ord(x)
-                 for i, x in enumerate(match.group(1))]
-        product = sum(parts)
+        product = _codename_weight(match['g3_code'].encode('ascii'))
         subproduct = 0
 
-    else:
-        assert False
-
     return (group, product, subproduct, product_name)
 
 
@@ -107,6 +119,4 @@ def sort_gpus(product_names: list[str]) -> list[str]:
     Returns:
         A list of Arm GPU products in presentation order.
     '''
-    product_list = [_sort_gpu_code(x) for x in product_names]
-    product_list.sort()
-    return [x[3] for x in product_list]
+    return sorted(product_names, key=_sort_gpu_code)
@@ -31,7 +31,7 @@ do not check the validity of the data in the hardware layout database.
 import sys
 import unittest
 
-from .database import CounterDatabase
+from .database import CounterDatabase, _LazyDatabase
 
 
 class DatabaseTestSuite(unittest.TestCase):
@@ -39,41 +39,94 @@ class DatabaseTestSuite(unittest.TestCase):
     Unit tests for the database module.
     '''
 
+    @classmethod
+    def setUpClass(cls):
+        '''
+        Load the GPU list once for all tests in the suite.
+        '''
+        cls.gpus = CounterDatabase.get_supported_gpus()
+
     def test_database_gpu_list(self):
         '''
         Test the database can list GPUs.
         '''
-        gpu_count = 0
-        gpus = CounterDatabase.get_supported_gpus()
-        gpu_count = len(gpus)
+        gpu_count = len(self.gpus)
 
         print(f'Test loaded {gpu_count} products')
         self.assertGreater(gpu_count, 0)
 
+    def test_database_gpu_set(self):
+        '''
+        Test the database GPU set matches the GPU list.
+        '''
+        gpu_set = CounterDatabase.get_supported_gpus_set()
+        self.assertEqual(set(self.gpus), gpu_set)
+
     def test_database_architecture_info_smoke(self):
         '''
         Test we can load all architecture info.
         '''
-        gpus = CounterDatabase.get_supported_gpus()
-        for gpu in gpus:
+        for gpu in self.gpus:
             p_info = CounterDatabase.get_product_info_for(gpu)
             a_info = CounterDatabase.get_architecture_info_for(gpu)
             self.assertEqual(p_info.architecture, a_info.name)
 
+    def test_database_lazy_load_from_subclass(self):
+        '''
+        Test a lazy database loads onto the defining class via a subclass.
+        '''
+        # pylint: disable=too-few-public-methods
+        class Base:
+            '''
+            Class defining a lazy database.
+            '''
+            g_db = _LazyDatabase(lambda: 42)
+
+        class Derived(Base):
+            '''
+            Subclass that triggers the first load.
+            '''
+
+        self.assertEqual(Derived.g_db, 42)
+        self.assertEqual(Base.__dict__['g_db'], 42)
+        self.assertNotIn('g_db', Derived.__dict__)
+
     def test_database_indexed_view_smoke(self):
         '''
         Test we can load all indexed views.
         '''
         counter_count = 0
 
-        gpus = CounterDatabase.get_supported_gpus()
-        for gpu in gpus:
+        for gpu in self.gpus:
             view = CounterDatabase.get_indexed_view_for(gpu)
             counter_count += len(list(view))
 
         print(f'Test loaded {counter_count} indexed counters')
         self.assertGreater(counter_count, 0)
 
+    def test_database_prewarm_views(self):
+        '''
+        Test prewarming builds the indexed views for all GPUs.
+        '''
+        CounterDatabase.clear_cache()
+        self.assertIsNone(CounterDatabase.prewarm_views())
+        for gpu in self.gpus:
+            self.assertIn(gpu, CounterDatabase.g_iview_db)
+
+        # Background builds wait for any other thread holding the build lock
+        CounterDatabase.clear_cache()
+        with CounterDatabase.g_build_lock:
+            thread = CounterDatabase.prewarm_views(background=True)
+            assert thread is not None
+            thread.join(0.1)
+            self.assertTrue(thread.is_alive())
+            self.assertFalse(CounterDatabase.g_iview_db)
+
+        thread.join()
+        self.assertFalse(thread.is_alive())
+        for gpu in self.gpus:
+            self.assertIn(gpu, CounterDatabase.g_iview_db)
+
     def test_database_hardware_view_smoke(self):
         '''
         Test we can load all hardware views.
@@ -81,8 +134,7 @@ class DatabaseTestSuite(unittest.TestCase):
         b_count = 0
         c_count = 0
 
-        gpus = CounterDatabase.get_supported_gpus()
-        for gpu in gpus:
+        for gpu in self.gpus:
             view = CounterDatabase.get_hardware_view_for(gpu)
             for block in view:
                 b_count += 1
@@ -101,8 +153,7 @@ class DatabaseTestSuite(unittest.TestCase):
         g_count = 0
         c_count = 0
 
-        gpus = CounterDatabase.get_supported_gpus()
-        for gpu in gpus:
+        for gpu in self.gpus:
             view = CounterDatabase.get_semantic_view_for(gpu)
             for section in view:
                 s_count += 1
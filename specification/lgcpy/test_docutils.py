@@ -0,0 +1,79 @@
+#
+# Copyright (c) 2025 Arm Limited.
+#
+# SPDX-License-Identifier: MIT
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+'''
+This module contains tests for the documentation utilities module.
+
+These tests aim to sense check the implementation of the Python code, and
+do not check the validity of the data in the database.
+'''
+
+import sys
+import unittest
+
+from .database import CounterDatabase
+from . import docutils as du
+
+
+class DocUtilsTestSuite(unittest.TestCase):
+    '''
+    Unit tests for the documentation utilities module.
+    '''
+
+    def test_resolve_docs(self):
+        '''
+        Test batch resolves match resolving each document in turn.
+        '''
+        view = CounterDatabase.get_indexed_view_for('Mali-G710')
+        documents = [
+            f'{{{{C::{x.machine_name}}}}} on {{{{K::GPU_NAME}}}}.'
+            for x in view.by_stable_id.values()]
+        documents.append('No references.')
+
+        resolved = du.resolve_docs(documents, view)
+        expected = [du.resolve_doc_to_text(x, view) for x in documents]
+        self.assertEqual(resolved, expected)
+        self.assertEqual(resolved[-1], 'No references.')
+        self.assertTrue(resolved[0].endswith(' on Mali-G710.'))
+
+        resolved = du.resolve_docs(documents, view, True)
+        expected = [du.resolve_doc_to_hyperlink(x, view) for x in documents]
+        self.assertEqual(resolved, expected)
+        self.assertTrue(resolved[0].startswith('<a href="#'))
+
+        self.assertEqual(du.resolve_docs(iter([]), view), [])
+
+
+def main() -> int:
+    '''
+    The main function.
+
+    Returns:
+        Process return code.
+    '''
+    results = unittest.main(exit=False)
+    return 0 if results.result.wasSuccessful() else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,149 @@
+#
+# Copyright (c) 2025 Arm Limited.
+#
+# SPDX-License-Identifier: MIT
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+'''
+This module contains tests for the XML utilities module.
+
+These tests aim to sense check the implementation of the Python code, and
+do not check the validity of the data in the database.
+'''
+
+import pathlib
+import sys
+import tempfile
+import unittest
+import xml.etree.ElementTree as et
+
+from . import xmlutils as xu
+
+
+class XmlUtilsTestSuite(unittest.TestCase):
+    '''
+    Unit tests for the XML utilities module.
+    '''
+
+    def test_add_copyright_to_xml_str(self):
+        '''
+        Test the copyright comment is added after the XML declaration.
+        '''
+        expected = '<?xml?>\n<!--\nC\n-->\n<a/>\n'
+
+        result = xu.add_copyright_to_xml_str('<?xml?>\n<a/>', 'C')
+        self.assertEqual(result, expected)
+
+        # CRLF line endings are normalized
+        result = xu.add_copyright_to_xml_str('<?xml?>\r\n<a/>\r\n', 'C')
+        self.assertEqual(result, expected)
+
+        # Empty documents get only the comment
+        result = xu.add_copyright_to_xml_str('', 'C')
+        self.assertEqual(result, '<!--\nC\n-->\n')
+
+    def test_get_copyright_from_xml_str(self):
+        '''
+        Test the copyright is the first comment outside the root element.
+        '''
+        result = xu.get_copyright_from_xml_str('<!-- C -->\n<a/>\n')
+        self.assertEqual(result, 'C')
+
+        # Comments inside the root element are skipped
+        result = xu.get_copyright_from_xml_str('<a><!-- B --></a><!-- C -->')
+        self.assertEqual(result, 'C')
+
+        result = xu.get_copyright_from_xml_str('<a><!-- B --></a>')
+        self.assertEqual(result, '')
+
+        # Malformed documents are rejected
+        with self.assertRaises(et.ParseError):
+            xu.get_copyright_from_xml_str('<!-- C --><a/>k: v<!-- C -->')
+
+    def test_get_copyright_from_yaml_str(self):
+        '''
+        Test the copyright is the first block of comment lines.
+        '''
+        result = xu.get_copyright_from_yaml_str('# a\n# b\nk: v\n# c\n')
+        self.assertEqual(result, '# a\n# b')
+
+        # Any line ending str.splitlines() accepts ends a line
+        result = xu.get_copyright_from_yaml_str('# y\r\nk: v')
+        self.assertEqual(result, '# y')
+
+        result = xu.get_copyright_from_yaml_str('# y\r# z\x0ck: v')
+        self.assertEqual(result, '# y\n# z')
+
+    def test_pretty_xml_whitespace_line(self):
+        '''
+        Test whitespace-only wrapped lines are not indented.
+        '''
+        data = '    aab-* {{C::x}}'
+        expected = '\n    \n      aab-\n      * {{\n      C::x\n      }}\n    '
+
+        result = xu.to_pretty_xml(data, True, 6, 4, 10)
+        self.assertEqual(result, expected)
+
+    def test_pretty_xml_round_trip(self):
+        '''
+        Test pretty printed paragraphs and lists round trip.
+        '''
+        data = 'First paragraph.\n* Item one.\n* Item two.\nLast.'
+
+        result = xu.to_pretty_xml(data, True, 6, 4, 79)
+        self.assertEqual(xu.from_pretty_xml(result, True), data)
+
+    def test_write_file_if_changed(self):
+        '''
+        Test files are only rewritten if their content changes.
+        '''
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = pathlib.Path(tmp_dir) / 'test.xml'
+
+            # Missing file is written
+            self.assertTrue(xu.write_file_if_changed(file_path, 'a\nb\n'))
+            self.assertEqual(file_path.read_bytes(), b'a\nb\n')
+
+            # Unchanged file is not rewritten
+            self.assertFalse(xu.write_file_if_changed(file_path, 'a\nb\n'))
+
+            # Changed file is rewritten
+            self.assertTrue(xu.write_file_if_changed(file_path, 'a\nc\n'))
+            self.assertEqual(file_path.read_bytes(), b'a\nc\n')
+
+            # CRLF file is normalized to LF
+            file_path.write_bytes(b'a\r\nc\r\n')
+            self.assertTrue(xu.write_file_if_changed(file_path, 'a\nc\n'))
+            self.assertEqual(file_path.read_bytes(), b'a\nc\n')
+
+
+def main() -> int:
+    '''
+    The main function.
+
+    Returns:
+        Process return code.
+    '''
+    results = unittest.main(exit=False)
+    return 0 if results.result.wasSuccessful() else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -30,6 +30,7 @@ that represents the state of the counter for a specific target GPU.
 from __future__ import annotations
 
 import enum
+import sys
 from typing import Any, Optional, TYPE_CHECKING
 
 from .. import equationutils as eu
@@ -53,6 +54,33 @@ class CounterClockDomain(enum.Enum):
     SHADER_CORE = 2
 
 
+# Clock domains of hardware blocks that are not in the GPU clock domain
+ClockDomainMap = dict[HBType, CounterClockDomain]
+
+ASYNC_CLOCK_DOMAINS: ClockDomainMap = {
+    HBType.SHADER_CORE: CounterClockDomain.SHADER_CORE
+}
+
+SYNC_CLOCK_DOMAINS: ClockDomainMap = {}
+
+
+def get_clock_domains(pi: PInfo) -> ClockDomainMap:
+    '''
+    Get the non-GPU clock domains of hardware blocks for a GPU.
+
+    Args:
+        pi: Product info for this GPU.
+
+    Returns:
+        Map of block type to clock domain, for blocks that are not in the GPU
+        clock domain.
+    '''
+    if pi.has_feature('async_clock'):
+        return ASYNC_CLOCK_DOMAINS
+
+    return SYNC_CLOCK_DOMAINS
+
+
 class CounterView:
     '''
     A view onto the counter info, compiled for a specific GPU.
@@ -75,13 +103,38 @@ class CounterView:
         equation_text: Textual equation.
         equation_ast: AST equation.
         equation_ast_resolved: AST equation that has been resolved to remove
-            any symbolic references to other derived counters.
+            any symbolic references to other derived counters. This is
+            resolved on first use against the owning view.
         equation_ast_resolved_error: Any error that occurrent when trying to
             resolve an AST. This should never happen in release builds.
+        index_view: The index view that owns this counter, used to resolve
+            equations on first use. Set by the view factory.
+        machine_key: Lower case machine name, used as an index key.
+        source_key: Lower case source name, or None if derived.
+        visibility_value: Integer value of the visibility level.
+        derived: True if this is a derived counter.
+        hardware_visibility_value: Integer value of the visibility level for
+            hardware counters, or sys.maxsize for derived counters, so
+            filters that hide derived counters need only one comparison.
+        human_key: Lower case human name, used as an index key.
+        group_key: Lower case group name and group human name pair, used as
+            an index key.
+        anchor: Stable HTML anchor name.
     '''
     # pylint: disable=too-many-instance-attributes
 
-    def __init__(self, pi: PInfo, hw_name: Optional[str],
+    __slots__ = (
+        'block_type', 'block_index', 'scale_multiplier', 'clock_domain',
+        'machine_name', 'stable_id', 'human_name', 'group_name',
+        'group_human_name', 'visibility', 'short_description',
+        'long_description', 'unit', 'trend', 'equation_ast',
+        '_equation_ast_resolved', '_equation_ast_resolved_error',
+        '_resolved', 'index_view', 'source_name', 'machine_key', 'source_key',
+        'human_key', 'group_key', 'visibility_value', 'derived',
+        'hardware_visibility_value', 'anchor',
+        '_streamline_name')
+
+    def __init__(self, clock_domains: ClockDomainMap, hw_name: Optional[str],
                  hw_bl: Optional[HBLayout], hw_cl: Optional[HCLayout],
                  ci: CInfo):
         # ----
@@ -106,15 +159,10 @@ class CounterView:
         # Derived counter, so no clock domain
         if not self.block_type:
             self.clock_domain = None
-        # Hardware counter on GPU with only 1 clock domain
-        elif not pi.has_feature('async_clock'):
-            self.clock_domain = CounterClockDomain.GPU
-        # Shader counter on GPU with async clock domain
-        elif self.block_type == HBType.SHADER_CORE:
-            self.clock_domain = CounterClockDomain.SHADER_CORE
-        # Any other counter on GPU with async clock domain
+        # Hardware counter, which is in the GPU domain unless mapped
         else:
-            self.clock_domain = CounterClockDomain.GPU
+            self.clock_domain = clock_domains.get(
+                self.block_type, CounterClockDomain.GPU)
 
         # ----
         # Counter info from the counter database
@@ -134,14 +182,32 @@ class CounterView:
         self.unit = ci.units
         self.trend = ci.trend
 
-        # Handle equations, but we cannot resolve yet so do that later
+        # Handle equations, but we cannot resolve yet so do that on first use
         self.equation_ast = ci.equation_ast
-        self.equation_ast_resolved: Optional[Any] = None
-        self.equation_ast_resolved_error: Optional[str] = None
+        self.index_view: Optional[IndexedView] = None
+        self._equation_ast_resolved: Optional[Any] = None
+        self._equation_ast_resolved_error: Optional[str] = None
+        self._resolved = False
 
         # Use the passed name which is the specific alias for this GPU
         self.source_name = hw_name
 
+        # Precomputed index keys, as views use case-insensitive lookups. Keys
+        # are interned so views of different GPUs share one string per key
+        self.machine_key = sys.intern(self.machine_name.lower())
+        self.source_key = sys.intern(hw_name.lower()) if hw_name else None
+        self.human_key = sys.intern(self.human_name.lower())
+        self.group_key = (sys.intern(self.group_name.lower()),
+                          sys.intern(self.group_human_name.lower()))
+        self.visibility_value: int = self.visibility.value
+        self.derived = not hw_name
+        self.hardware_visibility_value = \
+            sys.maxsize if self.derived else self.visibility_value
+        self.anchor = f'c_{self.stable_id}'
+
+        # Derived names that are built on first use
+        self._streamline_name: Optional[str] = None
+
     def resolve_equation(self, index_view: IndexedView) -> None:
         '''
         Resolve the compiled equation to remove derived references.
@@ -149,12 +215,67 @@ class CounterView:
         Args:
             index_view: The compiled index view for this GPU.
         '''
+        self._resolved = True
         if not self.equation_ast:
             return
 
+        # Reuse the resolve if another equation referencing us already did it
+        cache = index_view.resolve_cache
+        resolved = cache.get(self.machine_name)
+        if resolved is not None:
+            self._equation_ast_resolved = resolved
+            self._equation_ast_resolved_error = None
+            return
+
         result = eu.equation_ast_to_resolved_ast(self.equation_ast, index_view)
-        self.equation_ast_resolved = result[0]
-        self.equation_ast_resolved_error = result[1]
+        self._equation_ast_resolved = result[0]
+        self._equation_ast_resolved_error = result[1]
+
+        if result[0] is not None:
+            cache[self.machine_name] = result[0]
+
+    def _resolve_on_first_use(self) -> None:
+        '''
+        Resolve the compiled equation against the owning view if needed.
+        '''
+        if not self._resolved and self.equation_ast:
+            assert self.index_view is not None
+            self.resolve_equation(self.index_view)
+
+    @property
+    def equation_ast_resolved(self) -> Optional[Any]:
+        '''
+        Get the resolved AST equation, resolving it on first use.
+
+        Returns:
+            The resolved AST, or None if not derived or resolve failed.
+        '''
+        self._resolve_on_first_use()
+        return self._equation_ast_resolved
+
+    @property
+    def equation_ast_resolved_error(self) -> Optional[str]:
+        '''
+        Get the resolve error, resolving the equation on first use.
+
+        Returns:
+            The resolve error, or None if resolve succeeded.
+        '''
+        self._resolve_on_first_use()
+        return self._equation_ast_resolved_error
+
+    @property
+    def streamline_name(self) -> str:
+        '''
+        The Streamline variable name for this counter, built on first use.
+
+        Only valid for hardware counters.
+        '''
+        if self._streamline_name is None:
+            self._streamline_name = \
+                eu.EquationStreamlineTransformer.mangle_variable_name(self)
+
+        return self._streamline_name
 
     def get_anchor(self) -> str:
         '''
@@ -166,7 +287,7 @@ class CounterView:
         Returns:
             A stable anchor name.
         '''
-        return f'c_{self.stable_id}'
+        return self.anchor
 
     def is_derived(self) -> bool:
         '''
@@ -175,7 +296,7 @@ class CounterView:
         Returns:
             True if derived, False otherwise.
         '''
-        return not self.source_name
+        return self.derived
 
     def is_visible(self, max_visibility: CVisibility) -> bool:
         '''
@@ -187,7 +308,7 @@ class CounterView:
         Returns:
             True if visible, False otherwise.
         '''
-        return self.visibility.value <= max_visibility.value
+        return self.visibility_value <= max_visibility.value
 
     def is_novice(self) -> bool:
         '''
@@ -28,6 +28,8 @@ a specific GPU that can be iterated based on hardware block memory layout.
 
 from __future__ import annotations
 
+from itertools import chain
+from operator import attrgetter
 from typing import Iterator
 
 from ..data.counterinfo import CounterVisibility as CVisibility
@@ -39,25 +41,59 @@ from .counterview import CounterView
 from .indexedview import IndexedView
 
 
-class HardwareBlockView(list[CounterView]):
+class HardwareBlockView:
     '''
     Container for counters in a single memory block for a single GPU.
 
     Attributes:
         btype: Hardware counter block type.
+        counters: Counters in hardware order.
     '''
 
-    def __init__(self, btype: HBType):
+    __slots__ = ('btype', 'counters')
+
+    def __init__(self, btype: HBType, counters: tuple[CounterView, ...] = ()):
         '''
-        Construct a new empty HardwareBlockView.
+        Construct a new HardwareBlockView.
 
         Expected to be populated via a factory function.
 
         Args:
             btype: Hardware block type.
+            counters: Counters in hardware order.
         '''
-        super().__init__()
         self.btype = btype
+        self.counters = counters
+
+    def __iter__(self) -> Iterator[CounterView]:
+        '''
+        Iterate all counters in this block.
+
+        Returns:
+            Iterator of counters in hardware order.
+        '''
+        return iter(self.counters)
+
+    def __len__(self) -> int:
+        '''
+        Get the number of counters in this block.
+
+        Returns:
+            The number of counters.
+        '''
+        return len(self.counters)
+
+    def __getitem__(self, index: int) -> CounterView:
+        '''
+        Get a counter by position in this block.
+
+        Args:
+            index: The position in hardware order.
+
+        Returns:
+            The counter at that position.
+        '''
+        return self.counters[index]
 
     @classmethod
     def from_db(cls, hw_db: HBLayout,
@@ -71,15 +107,13 @@ class HardwareBlockView(list[CounterView]):
 
         Returns:
             The compiled view of the block.
-        '''
-        view = cls(hw_db.btype)
-
-        for hw_cnt in hw_db:
-            child_view = i_view.get_by_source_name(hw_cnt.name)
-            assert child_view
-            view.append(child_view)
 
-        return view
+        Raises:
+            KeyError if a layout counter is not found in the index.
+        '''
+        by_source_name = i_view.by_source_name
+        counters = tuple(by_source_name[x.name.lower()] for x in hw_db)
+        return cls(hw_db.btype, counters)
 
 
 class HardwareView(list[HardwareBlockView]):
@@ -91,11 +125,28 @@ class HardwareView(list[HardwareBlockView]):
         '''
         Iterate all counters in the view.
 
-        Yields:
-            Counters in hardware order.
+        Returns:
+            Iterator of counters in hardware order.
+        '''
+        return chain.from_iterable(self)
+
+    def stable_ids(self) -> list[int]:
         '''
-        for block in self:
-            yield from block
+        Get the stable IDs of all counters in the view.
+
+        Returns:
+            List of stable IDs in hardware order.
+        '''
+        return list(map(attrgetter('stable_id'), chain.from_iterable(self)))
+
+    def machine_names(self) -> list[str]:
+        '''
+        Get the machine names of all counters in the view.
+
+        Returns:
+            List of machine names in hardware order.
+        '''
+        return list(map(attrgetter('machine_name'), chain.from_iterable(self)))
 
     def filter(self, max_visibility: CVisibility,
                derived: bool) -> HardwareView:
@@ -105,23 +156,35 @@ class HardwareView(list[HardwareBlockView]):
         Args:
             max_visibility: Show up to this visibility level.
             derived: Show derived counters.
+
+        Returns:
+            The filtered view.
         '''
+        # The identity filter keeps every block, so only copy the view
+        if max_visibility is CVisibility.INTERNAL and derived:
+            return HardwareView(self)
+
         filtered_view = HardwareView()
+        max_value = max_visibility.value
 
         for block in self:
-            filtered_block = HardwareBlockView(block.btype)
-
-            for counter in block:
-                if not counter.is_visible(max_visibility):
-                    continue
-
-                if counter.is_derived() and not derived:
-                    continue
-
-                filtered_block.append(counter)
+            # Specialize the predicate so the derived flag is not retested
+            if derived:
+                kept = [x for x in block.counters
+                        if x.visibility_value <= max_value]
+            else:
+                kept = [x for x in block.counters
+                        if x.hardware_visibility_value <= max_value]
+
+            if not kept:
+                continue
 
-            if filtered_block:
-                filtered_view.append(filtered_block)
+            # Block counters are tuples, so share unfiltered blocks
+            if len(kept) == len(block):
+                filtered_view.append(block)
+            else:
+                filtered_view.append(
+                    HardwareBlockView(block.btype, tuple(kept)))
 
         return filtered_view
 
@@ -33,14 +33,15 @@ counters is possible, but is unstructured.
 
 from __future__ import annotations
 
-from typing import Iterator, Optional
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping, Optional
 
 from ..data.productinfo import ProductInfo as PInfo
 from ..data.counterinfo import CounterVisibility as CVisibility
 from ..data.counterinfo import CounterInfos as CInfos
 from ..data.hardwarelayout import HardwareLayout as HWLayout
 
-from .counterview import CounterView
+from .counterview import CounterView, get_clock_domains
 
 
 class IndexedView:
@@ -58,10 +59,24 @@ class IndexedView:
         by_source_name: Map of counters indexed by Source Name. This map only
             contains hardware counters, as derived counters have no source.
         by_human_name: Map of counters indexed by Human Name.
-        by_groups_names: Map of counters indexed by Group Name and Group
-            Human Name.
+        by_groups_names: Map of counters indexed by a Group Name and Group
+            Human Name tuple.
+        resolve_cache: Map of resolved equation ASTs indexed by Machine Name,
+            used to share resolves of derived counters referenced by many
+            equations.
+        transformer_cache: Map of shared equation transformers for this view,
+            indexed by transformer type.
+        resolver_cache: Map of shared documentation reference resolvers for
+            this view, indexed by counter renderer.
+        filter_cache: Map of filtered views indexed by maximum visibility
+            value and derived flag.
     '''
 
+    __slots__ = (
+        'gpu', 'key', 'by_stable_id', 'by_machine_name', 'by_source_name',
+        'by_human_name', 'by_group_names', 'resolve_cache',
+        'transformer_cache', 'resolver_cache', 'filter_cache')
+
     def __init__(self, gpu: str, key: str):
         '''
         Construct a new empty IndexedView.
@@ -76,19 +91,61 @@ class IndexedView:
         self.key = key
 
         # Indexes to allow random access lookups
-        self.by_stable_id: dict[int, CounterView] = {}
-        self.by_machine_name: dict[str, CounterView] = {}
-        self.by_source_name: dict[str, CounterView] = {}
-        self.by_human_name: dict[str, CounterView] = {}
-        self.by_group_names: dict[str, CounterView] = {}
+        self.by_stable_id: Mapping[int, CounterView] = MappingProxyType({})
+        self.by_machine_name: Mapping[str, CounterView] = MappingProxyType({})
+        self.by_source_name: Mapping[str, CounterView] = MappingProxyType({})
+        self.by_human_name: Mapping[str, CounterView] = MappingProxyType({})
+        self.by_group_names: Mapping[tuple[str, str], CounterView] = (
+            MappingProxyType({}))
+
+        # Cache of resolved equations for derived counters
+        self.resolve_cache: dict[str, Any] = {}
+
+        # Cache of equation transformers bound to this view
+        self.transformer_cache: dict[type, Any] = {}
+
+        # Cache of documentation reference resolvers bound to this view
+        self.resolver_cache: dict[Any, Any] = {}
+
+        # Cache of filtered views, with read-only indexes
+        self.filter_cache: dict[tuple[int, bool], IndexedView] = {}
 
     def resolve_equations(self) -> None:
         '''
         Eagerly resolve all resolved equations ahead of time.
+
+        This is optional, as counters otherwise resolve their equation on
+        first use against the view that built them.
+
+        Resolves are shared via the view resolve cache, so each derived
+        counter is resolved once regardless of how many equations use it.
         '''
         for counter in self.by_stable_id.values():
             counter.resolve_equation(self)
 
+    def build_indexes(self, counters: list[CounterView]) -> None:
+        '''
+        Replace the lookup indexes with indexes for a list of counters.
+
+        Each index is built in a single pass, rather than growing all of them
+        one counter at a time, and is read-only so views can be shared.
+
+        Args:
+            counters: The counters to index.
+        '''
+        self.by_stable_id = MappingProxyType(
+            {x.stable_id: x for x in counters})
+        self.by_machine_name = MappingProxyType(
+            {x.machine_key: x for x in counters})
+        # Derived counters have no source key. Filtering them inline measures
+        # as fast as indexing them all and popping the None key afterwards
+        self.by_source_name = MappingProxyType(
+            {x.source_key: x for x in counters if x.source_key})
+        self.by_human_name = MappingProxyType(
+            {x.human_key: x for x in counters})
+        self.by_group_names = MappingProxyType(
+            {x.group_key: x for x in counters})
+
     def get_by_stable_id(self, key: int) -> Optional[CounterView]:
         '''
         Get a counter by database stable ID.
@@ -152,54 +209,60 @@ class IndexedView:
         Returns:
             Counter view if found, None otherwise.
         '''
-        group_index = f'{group_name}|{group_human_name}'
-        return self.by_group_names.get(group_index.lower(), None)
+        group_index = (group_name.lower(), group_human_name.lower())
+        return self.by_group_names.get(group_index, None)
 
     def __iter__(self) -> Iterator[CounterView]:
         '''
         Iterate all counters for this GPU in an unstructured way.
 
-        Yields:
-            Counter series in arbitrary order.
+        Returns:
+            Iterator of counter series in arbitrary order.
         '''
-        yield from self.by_machine_name.values()
+        return iter(self.by_machine_name.values())
 
-    def filter(self, max_visibility: CVisibility,
-               derived: bool) -> IndexedView:
+    def select(self, max_visibility: CVisibility,
+               derived: bool) -> list[CounterView]:
         '''
-        Create a filtered copy of this view to hide counters.
+        Select the counters that pass a filter, without building a view.
 
         Args:
-            max_visibility: Show up to this visibility level.
-            derived: Show derived counters.
-        '''
-        filtered_view = IndexedView(self.gpu, self.key)
+            max_visibility: Select up to this visibility level.
+            derived: Select derived counters.
 
+        Returns:
+            The selected counters, in database order.
+        '''
         # Iterate by Stable ID as all counters are in that map
-        for counter in self.by_stable_id.values():
-            if not counter.is_visible(max_visibility):
-                continue
+        value = max_visibility.value
+        counters = self.by_stable_id.values()
+        if derived:
+            return [x for x in counters if x.visibility_value <= value]
 
-            if counter.is_derived() and not derived:
-                continue
-
-            # Add the indexes
-            filtered_view.by_stable_id[counter.stable_id] = counter
+        return [x for x in counters
+                if x.visibility_value <= value and not x.derived]
 
-            key = counter.machine_name.lower()
-            filtered_view.by_machine_name[key] = counter
+    def filter(self, max_visibility: CVisibility,
+               derived: bool) -> IndexedView:
+        '''
+        Create a filtered copy of this view to hide counters.
 
-            if counter.source_name:
-                key = counter.source_name.lower()
-                filtered_view.by_source_name[key] = counter
+        Args:
+            max_visibility: Show up to this visibility level.
+            derived: Show derived counters.
 
-            key = counter.human_name.lower()
-            filtered_view.by_human_name[key] = counter
+        Returns:
+            The filtered view, which is shared by repeated calls.
+        '''
+        cache_key = (max_visibility.value, derived)
+        filtered_view = self.filter_cache.get(cache_key)
+        if filtered_view is not None:
+            return filtered_view
 
-            group_index = f'{counter.group_name}|{counter.group_human_name}'
-            key = group_index.lower()
-            filtered_view.by_group_names[key] = counter
+        filtered_view = IndexedView(self.gpu, self.key)
+        filtered_view.build_indexes(self.select(max_visibility, derived))
 
+        self.filter_cache[cache_key] = filtered_view
         return filtered_view
 
     @classmethod
@@ -215,6 +278,11 @@ class IndexedView:
             ct_db: Counter database.
         '''
         view = cls(product, pi.database_key)
+        counters = []
+
+        # Hoist the hardware name lookup and clock domains out of the loop
+        get_hw_counter = hw_db.get_counter_by_name
+        clock_domains = get_clock_domains(pi)
 
         for counter in ct_db:
             # Skip counters that don't apply to this GPU
@@ -225,42 +293,30 @@ class IndexedView:
             # a name alias
             hw_bl = None
             hw_cl = None
-            hw_name = None
+            hw_name = counter.source_name
 
             # TODO: Store the alias per GPU in the CounterInfo XML, avoiding
             # potential ambiguity and the need to search here
-            if counter.source_name:
-                source_names = [counter.source_name]
-                source_names.extend(counter.source_name_aliases)
-                for name in source_names:
-                    hw_data = hw_db.get_counter_by_name(name)
-                    if hw_data:
-                        hw_name = name
-                        hw_bl, hw_cl = hw_data
-                        break
-                else:
-                    # This is an error, but picked up by validator
-                    hw_name = counter.source_name
-                    hw_bl = None
+            if hw_name:
+                hw_data = get_hw_counter(hw_name)
 
-            # Build the view
-            ct_view = CounterView(pi, hw_name, hw_bl, hw_cl, counter)
-
-            # Add the indexes
-            view.by_stable_id[ct_view.stable_id] = ct_view
-
-            key = ct_view.machine_name.lower()
-            view.by_machine_name[key] = ct_view
+                # Only search aliases if the canonical name is not present
+                if not hw_data:
+                    for name in counter.source_name_aliases:
+                        hw_data = get_hw_counter(name)
+                        if hw_data:
+                            hw_name = name
+                            break
 
-            if ct_view.source_name:
-                key = ct_view.source_name.lower()
-                view.by_source_name[key] = ct_view
+                # A missing counter is an error, but picked up by validator
+                if hw_data:
+                    hw_bl, hw_cl = hw_data
 
-            key = ct_view.human_name.lower()
-            view.by_human_name[key] = ct_view
-
-            group_index = f'{ct_view.group_name}|{ct_view.group_human_name}'
-            key = group_index.lower()
-            view.by_group_names[key] = ct_view
+            # Build the view
+            ct_view = CounterView(
+                clock_domains, hw_name, hw_bl, hw_cl, counter)
+            ct_view.index_view = view
+            counters.append(ct_view)
 
+        view.build_indexes(counters)
         return view
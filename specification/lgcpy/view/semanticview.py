@@ -36,7 +36,10 @@ Counters can be presented as data series on that chart.
 from __future__ import annotations
 
 import string
-from typing import Iterator
+import sys
+from itertools import chain
+from types import MappingProxyType
+from typing import Iterable, Iterator, Mapping, NamedTuple, Optional
 
 from ..data.counterinfo import CounterVisibility as CVisibility
 from ..data.semanticlayout import SemanticLayout as SemLayout
@@ -44,10 +47,118 @@ from ..data.semanticlayout import SemanticSectionLayout as SemSecLayout
 from ..data.semanticlayout import SemanticGroupLayout as SemGrpLayout
 from ..data.semanticinfo import SemanticSectionInfos as SemSecInfos
 from ..data.semanticinfo import SemanticGroupInfos as SemGrpInfos
+from ..data.semanticinfo import SemanticSectionInfo as SemSecInfo
+from ..data.semanticinfo import SemanticGroupInfo as SemGrpInfo
 
 from .counterview import CounterView
 from .indexedview import IndexedView
 
+# Translation table deleting ASCII characters not allowed in anchors
+ANCHOR_VALID_CHARS = frozenset(string.ascii_lowercase + string.digits)
+ANCHOR_DELETE_CHARS = dict.fromkeys(
+    x for x in range(128) if chr(x) not in ANCHOR_VALID_CHARS)
+
+
+def _make_anchor(prefix: str, name: str) -> str:
+    '''
+    Make a stable HTML anchor name from a display name.
+
+    Args:
+        prefix: Anchor type prefix.
+        name: Display name to sanitize.
+
+    Returns:
+        A stable anchor name.
+    '''
+    anchor = name.lower().translate(ANCHOR_DELETE_CHARS)
+
+    # Non-ASCII characters are rare, so strip them in a slower second pass
+    if not anchor.isascii():
+        anchor = ''.join(x for x in anchor if x.isascii())
+
+    return f'{prefix}_{anchor}'
+
+
+class FilterBounds(NamedTuple):
+    '''
+    Summary of the counters below a group or section, used to filter whole
+    subtrees without visiting every counter.
+    '''
+    min_visibility: int
+    max_visibility: int
+    min_hardware_visibility: int
+    has_derived: bool
+
+    def hides_all(self, max_value: int, derived: bool) -> bool:
+        '''
+        Test if a filter would hide every counter in this subtree.
+
+        Args:
+            max_value: Maximum visibility value to keep.
+            derived: Keep derived counters.
+
+        Returns:
+            True if no counters pass the filter.
+        '''
+        if derived:
+            return self.min_visibility > max_value
+
+        return self.min_hardware_visibility > max_value
+
+    def keeps_all(self, max_value: int, derived: bool) -> bool:
+        '''
+        Test if a filter would keep every counter in this subtree.
+
+        Args:
+            max_value: Maximum visibility value to keep.
+            derived: Keep derived counters.
+
+        Returns:
+            True if all counters pass the filter.
+        '''
+        if not derived and self.has_derived:
+            return False
+
+        return self.max_visibility <= max_value
+
+    @classmethod
+    def from_counters(cls, counters: Iterable[CounterView]) -> FilterBounds:
+        '''
+        Summarize a set of counters.
+
+        Args:
+            counters: The counters to summarize.
+
+        Returns:
+            The summary.
+        '''
+        counters = list(counters)
+        return cls(min((x.visibility_value for x in counters),
+                       default=sys.maxsize),
+                   max((x.visibility_value for x in counters), default=0),
+                   min((x.hardware_visibility_value for x in counters),
+                       default=sys.maxsize),
+                   any(x.derived for x in counters))
+
+    @classmethod
+    def merge(cls, bounds: Iterable[FilterBounds]) -> FilterBounds:
+        '''
+        Summarize a set of summaries.
+
+        Args:
+            bounds: The summaries to merge.
+
+        Returns:
+            The merged summary.
+        '''
+        bounds = list(bounds)
+        return cls(min((x.min_visibility for x in bounds),
+                       default=sys.maxsize),
+                   max((x.max_visibility for x in bounds), default=0),
+                   min((x.min_hardware_visibility for x in bounds),
+                       default=sys.maxsize),
+                   any(x.has_derived for x in bounds))
+
 
 class SemanticGroupView:
     '''
@@ -56,9 +167,12 @@ class SemanticGroupView:
     Attributes:
         name: Counter database GroupName.
         long_description: Group documentation.
-        counters: Ordered map of counters.
+        counters: Ordered read-only map of counters.
+        anchor: Stable HTML anchor name.
     '''
 
+    __slots__ = ('name', 'long_description', 'anchor', 'counters', '_bounds')
+
     def __init__(self, name: str, long_description: str):
         '''
         Construct a new empty SemanticGroupView.
@@ -71,16 +185,70 @@ class SemanticGroupView:
         '''
         self.name = name
         self.long_description = long_description
-        self.counters: dict[str, CounterView] = {}
+        self.anchor = _make_anchor('g', name)
+
+        # Compact dicts already store entries as a dense ordered array with a
+        # separate sparse hash index, so no parallel name and view arrays
+        self.counters: Mapping[str, CounterView] = MappingProxyType({})
+
+        # Counter summary built on first filter
+        self._bounds: Optional[FilterBounds] = None
+
+    @property
+    def bounds(self) -> FilterBounds:
+        '''
+        Get the filter summary of counters in this group.
+
+        Returns:
+            The summary, built on first use.
+        '''
+        if self._bounds is None:
+            self._bounds = FilterBounds.from_counters(self.counters.values())
+
+        return self._bounds
 
     def __iter__(self) -> Iterator[CounterView]:
         '''
         Iterate all counters in this group.
 
-        Yields:
-            Counters in presentation order.
+        Returns:
+            Iterator of counters in presentation order.
+        '''
+        return iter(self.counters.values())
+
+    def filter(self, max_visibility: CVisibility,
+               derived: bool) -> Optional[SemanticGroupView]:
+        '''
+        Create a filtered copy of this group to hide counters.
+
+        Args:
+            max_visibility: Show up to this visibility level.
+            derived: Show derived counters.
+
+        Returns:
+            The filtered group, this group if the filter keeps everything, or
+            None if the filter hides everything.
         '''
-        yield from self.counters.values()
+        max_value = max_visibility.value
+
+        # Groups that lose nothing to the filter are shared rather than copied
+        if self.bounds.hides_all(max_value, derived):
+            return None
+
+        if self.bounds.keeps_all(max_value, derived):
+            return self
+
+        # Specialize the predicate so the derived flag is not retested
+        if derived:
+            kept = {k: v for k, v in self.counters.items()
+                    if v.visibility_value <= max_value}
+        else:
+            kept = {k: v for k, v in self.counters.items()
+                    if v.hardware_visibility_value <= max_value}
+
+        flt_grp = SemanticGroupView(self.name, self.long_description)
+        flt_grp.counters = MappingProxyType(kept)
+        return flt_grp
 
     def get_anchor(self) -> str:
         '''
@@ -92,11 +260,7 @@ class SemanticGroupView:
         Returns:
             A stable anchor name.
         '''
-        valid_chars = string.ascii_lowercase + string.digits
-
-        anchor = self.name.lower()
-        anchor = ''.join(x for x in anchor if x in valid_chars)
-        return f'g_{anchor}'
+        return self.anchor
 
     @classmethod
     def from_db(cls, gpu: str, sem_db: SemGrpLayout, grp_db: SemGrpInfos,
@@ -114,16 +278,26 @@ class SemanticGroupView:
             KeyError if GPU or group is not found.
         '''
         info = grp_db.get_info_for(gpu, sem_db.name)
+        return cls.from_info(sem_db, info, i_view)
 
-        sem_view = cls(sem_db.name, info.long_description)
+    @classmethod
+    def from_info(cls, sem_db: SemGrpLayout, info: SemGrpInfo,
+                  i_view: IndexedView) -> SemanticGroupView:
+        '''
+        Create a semantic counter memory layout from already resolved info.
 
-        for counter in sem_db:
-            child_view = i_view.get_by_group_names(
-                sem_view.name, counter.name)
+        Args:
+            sem_db: The unfiltered semantic layout to use as a data source.
+            info: The group info for this GPU.
+            i_view: Pre-compiled index view we can load counters from.
+        '''
+        sem_view = cls(sem_db.name, info.long_description)
 
-            # Only keep counters that exist!
-            if child_view:
-                sem_view.counters[counter.name] = child_view
+        # Only keep counters that exist!
+        get_counter = i_view.get_by_group_names
+        sem_view.counters = MappingProxyType({
+            x.name: child_view for x in sem_db
+            if (child_view := get_counter(sem_view.name, x.name))})
 
         return sem_view
 
@@ -135,9 +309,12 @@ class SemanticSectionView:
     Attributes:
         name: Name of the section name.
         long_description: Section documentation.
-        groups: Ordered map of groups.
+        groups: Ordered read-only map of groups.
+        anchor: Stable HTML anchor name.
     '''
 
+    __slots__ = ('name', 'long_description', 'anchor', 'groups', '_bounds')
+
     def __init__(self, name: str, long_description: str):
         '''
         Construct a new empty SemanticSectionView.
@@ -150,16 +327,69 @@ class SemanticSectionView:
         '''
         self.name = name
         self.long_description = long_description
-        self.groups: dict[str, SemanticGroupView] = {}
+        self.groups: Mapping[str, SemanticGroupView] = MappingProxyType({})
+        self.anchor = _make_anchor('s', name)
+
+        # Counter summary built on first filter
+        self._bounds: Optional[FilterBounds] = None
+
+    @property
+    def bounds(self) -> FilterBounds:
+        '''
+        Get the filter summary of counters in this section.
+
+        Returns:
+            The summary, built on first use.
+        '''
+        if self._bounds is None:
+            self._bounds = FilterBounds.merge(
+                x.bounds for x in self.groups.values())
+
+        return self._bounds
 
     def __iter__(self) -> Iterator[SemanticGroupView]:
         '''
         Iterate all groups in this section.
 
-        Yields:
-            Counter groups in presentation order.
+        Returns:
+            Iterator of counter groups in presentation order.
+        '''
+        return iter(self.groups.values())
+
+    def filter(self, max_visibility: CVisibility,
+               derived: bool) -> Optional[SemanticSectionView]:
+        '''
+        Create a filtered copy of this section to hide counters.
+
+        Args:
+            max_visibility: Show up to this visibility level.
+            derived: Show derived counters.
+
+        Returns:
+            The filtered section, this section if the filter keeps everything,
+            or None if the filter hides everything.
         '''
-        yield from self.groups.values()
+        max_value = max_visibility.value
+
+        # Sections that lose nothing to the filter are shared rather than
+        # copied
+        if self.bounds.hides_all(max_value, derived):
+            return None
+
+        if self.bounds.keeps_all(max_value, derived):
+            return self
+
+        groups = {}
+        for grp_name, grp in self.groups.items():
+            flt_grp = grp.filter(max_visibility, derived)
+
+            # Keep group if it contains any counters after filtering
+            if flt_grp:
+                groups[grp_name] = flt_grp
+
+        flt_sec = SemanticSectionView(self.name, self.long_description)
+        flt_sec.groups = MappingProxyType(groups)
+        return flt_sec
 
     def get_anchor(self) -> str:
         '''
@@ -171,11 +401,7 @@ class SemanticSectionView:
         Returns:
             A stable anchor name.
         '''
-        valid_chars = string.ascii_lowercase + string.digits
-
-        anchor = self.name.lower()
-        anchor = ''.join(x for x in anchor if x in valid_chars)
-        return f's_{anchor}'
+        return self.anchor
 
     @classmethod
     def from_db(cls, key: str, sem_db: SemSecLayout,
@@ -195,22 +421,33 @@ class SemanticSectionView:
             KeyError if GPU is not found.
         '''
         info = sec_db.get_info_for(key, sem_db.name)
+        return cls.from_info(key, sem_db, info, grp_db, i_view)
 
-        sem_view = cls(sem_db.name, info.long_description)
+    @classmethod
+    def from_info(cls, key: str, sem_db: SemSecLayout, info: SemSecInfo,
+                  grp_db: SemGrpInfos,
+                  i_view: IndexedView) -> SemanticSectionView:
+        '''
+        Create a semantic counter memory layout from already resolved info.
 
-        # Parse the groups and associated counters
-        for group in sem_db:
-            try:
-                child_view = SemanticGroupView.from_db(
-                    key, group, grp_db, i_view)
+        Args:
+            key: The canonical database GPU name.
+            sem_db: The unfiltered semantic layout to use as a template.
+            info: The section info for this GPU.
+            grp_db: Group information database.
+            i_view: Pre-compiled index view we can load counters from.
+        '''
+        sem_view = cls(sem_db.name, info.long_description)
 
-                # Only keep groups that have counters for this GPU
-                if len(child_view.counters):
-                    sem_view.groups[group.name] = child_view
+        # Parse the groups and associated counters, skipping groups that have
+        # no match for this GPU. Each group info is looked up only once
+        child_views = [
+            SemanticGroupView.from_info(x, grp_info, i_view) for x in sem_db
+            if (grp_info := grp_db.try_get_info_for(key, x.name)) is not None]
 
-            # Group had no match for this GPU
-            except KeyError:
-                continue
+        # Only keep groups that have counters for this GPU
+        sem_view.groups = MappingProxyType(
+            {x.name: x for x in child_views if x.counters})
 
         return sem_view
 
@@ -220,46 +457,62 @@ class SemanticView:
     Container for blocks for a single GPU.
 
     Attributes:
-        sections: Ordered map of sections.
+        sections: Ordered read-only map of sections.
+        all_groups: Flattened groups in presentation order, built on first
+            iteration.
+        all_counters: Flattened counters in presentation order, built on
+            first iteration.
     '''
 
+    __slots__ = ('sections', 'all_groups', 'all_counters')
+
     def __init__(self):
         '''
         Construct a new empty SemanticView.
 
         Expected to be populated via a factory function.
         '''
-        self.sections: dict[str, SemanticSectionView] = {}
+        self.sections: Mapping[str, SemanticSectionView] = (
+            MappingProxyType({}))
+
+        # Sections are read-only, so flatten on first use
+        self.all_groups: Optional[tuple[SemanticGroupView, ...]] = None
+        self.all_counters: Optional[tuple[CounterView, ...]] = None
 
     def iter_sections(self) -> Iterator[SemanticSectionView]:
         '''
         Iterate all sections in the view.
 
-        Yields:
-            Sections in presentation order.
+        Returns:
+            Iterator of sections in presentation order.
         '''
-        yield from self.sections.values()
+        return iter(self.sections.values())
 
     def iter_groups(self) -> Iterator[SemanticGroupView]:
         '''
         Iterate all groups in the view.
 
-        Yields:
-            Groups in presentation order.
+        Returns:
+            Iterator of groups in presentation order.
         '''
-        for section in self.sections.values():
-            yield from section.groups.values()
+        if self.all_groups is None:
+            self.all_groups = tuple(chain.from_iterable(
+                x.groups.values() for x in self.sections.values()))
+
+        return iter(self.all_groups)
 
     def iter_counters(self) -> Iterator[CounterView]:
         '''
         Iterate all counters in the view.
 
-        Yields:
-            Counters in presentation order.
+        Returns:
+            Iterator of counters in presentation order.
         '''
-        for section in self.sections.values():
-            for group in section.groups.values():
-                yield from group.counters.values()
+        if self.all_counters is None:
+            self.all_counters = tuple(chain.from_iterable(
+                x.counters.values() for x in self.iter_groups()))
+
+        return iter(self.all_counters)
 
     def filter(self, max_visibility: CVisibility,
                derived: bool) -> SemanticView:
@@ -269,43 +522,36 @@ class SemanticView:
         Args:
             max_visibility: Show up to this visibility level.
             derived: Show derived counters.
+
+        Returns:
+            The filtered view.
         '''
         flt_view = SemanticView()
 
-        for sec_name, sec in self.sections.items():
-            flt_sec = SemanticSectionView(sec_name, sec.long_description)
-
-            for grp_name, grp in sec.groups.items():
-                flt_grp = SemanticGroupView(grp_name, grp.long_description)
-
-                for cnt_name, cnt in grp.counters.items():
-                    if not cnt.is_visible(max_visibility):
-                        continue
-
-                    if cnt.is_derived() and not derived:
-                        continue
+        # The identity filter keeps every section, so share the read-only map
+        if max_visibility is CVisibility.INTERNAL and derived:
+            flt_view.sections = self.sections
+            return flt_view
 
-                    # Keep counter if it passed
-                    flt_grp.counters[cnt_name] = cnt
-
-                # Keep group if it contains any counters after filtering
-                if flt_grp.counters:
-                    flt_sec.groups[grp_name] = flt_grp
+        sections = {}
+        for sec_name, sec in self.sections.items():
+            flt_sec = sec.filter(max_visibility, derived)
 
             # Keep section if it contains any groups after filtering
-            if flt_sec.groups:
-                flt_view.sections[sec_name] = flt_sec
+            if flt_sec:
+                sections[sec_name] = flt_sec
 
+        flt_view.sections = MappingProxyType(sections)
         return flt_view
 
     def __iter__(self) -> Iterator[SemanticSectionView]:
         '''
         Iterate all sections in the view.
 
-        Yields:
-            Counter sections in presentation order.
+        Returns:
+            Iterator of counter sections in presentation order.
         '''
-        yield from self.sections.values()
+        return iter(self.sections.values())
 
     @classmethod
     def from_db(cls, key: str, sem_db: SemLayout, sec_db: SemSecInfos,
@@ -322,18 +568,15 @@ class SemanticView:
         '''
         sem_view = cls()
 
-        # Parse the sections and associated groups
-        for section in sem_db:
-            try:
-                child_view = SemanticSectionView.from_db(
-                    key, section, sec_db, grp_db, i_view)
-
-                # Only keep sections that have groups for this GPU
-                if len(child_view.groups):
-                    sem_view.sections[section.name] = child_view
+        # Parse the sections and associated groups, skipping sections that
+        # have no match for this GPU. Each section info is looked up only once
+        child_views = [
+            SemanticSectionView.from_info(key, x, sec_info, grp_db, i_view)
+            for x in sem_db
+            if (sec_info := sec_db.try_get_info_for(key, x.name)) is not None]
 
-            # Section had no match for this GPU
-            except KeyError:
-                continue
+        # Only keep sections that have groups for this GPU
+        sem_view.sections = MappingProxyType(
+            {x.name: x for x in child_views if x.groups})
 
         return sem_view
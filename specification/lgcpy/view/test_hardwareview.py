@@ -29,6 +29,7 @@ do not check the validity of the data in the counter info database.
 '''
 
 import sys
+from typing import Optional
 import unittest
 
 from ..data.productinfo import ProductInfos
@@ -47,44 +48,54 @@ class HardwareViewTestSuite(unittest.TestCase):
 
     REF_GPU = 'Mali-G710'
 
+    pd_db: ProductInfos
+    hw_db: HardwareLayouts
+    ct_db: CounterInfos
+    ref_view: Optional[HardwareView] = None
+
+    @classmethod
+    def setUpClass(cls):
+        '''
+        Load the databases once for all tests in the suite.
+        '''
+        cls.pd_db = ProductInfos.from_file()
+        cls.hw_db = HardwareLayouts.from_files()
+        cls.ct_db = CounterInfos.from_files()
+
     def get_hw_view(self) -> HardwareView:
         '''
         Get a standard SemView we can use for testing.
         '''
-        gpu = self.REF_GPU
+        if self.ref_view is not None:
+            return self.ref_view
 
-        pd_db = ProductInfos.from_file()
-        pd_info = pd_db.get_gpu(gpu)
-
-        hw_db = HardwareLayouts.from_files()
-        hw_info = hw_db.get_gpu(pd_info.database_key)
+        gpu = self.REF_GPU
 
-        ct_db = CounterInfos.from_files()
+        pd_info = self.pd_db.get_gpu(gpu)
+        hw_info = self.hw_db.get_gpu(pd_info.database_key)
 
         # Build the base view
-        ct_view = IndexedView.from_db(gpu, pd_info, hw_info, ct_db)
+        ct_view = IndexedView.from_db(gpu, pd_info, hw_info, self.ct_db)
         self.assertIsNotNone(ct_view)
 
         # Build the structured view
         hw_view = HardwareView.from_db(hw_info, ct_view)
         self.assertIsNotNone(hw_view)
+
+        self.__class__.ref_view = hw_view
         return hw_view
 
     def test_smoke(self):
         '''
         Test the HardwareView can compile in all variants.
         '''
-        pd_db = ProductInfos.from_file()
-        hw_db = HardwareLayouts.from_files()
-        ct_db = CounterInfos.from_files()
-
-        gpus = pd_db.get_gpus()
+        gpus = self.pd_db.get_gpus()
         for gpu in gpus:
-            pd_info = pd_db.get_gpu(gpu)
-            hw_info = hw_db.get_gpu(pd_info.database_key)
+            pd_info = self.pd_db.get_gpu(gpu)
+            hw_info = self.hw_db.get_gpu(pd_info.database_key)
 
             # Build the base view
-            ct_view = IndexedView.from_db(gpu, pd_info, hw_info, ct_db)
+            ct_view = IndexedView.from_db(gpu, pd_info, hw_info, self.ct_db)
             self.assertIsNotNone(ct_view)
 
             # Build the structured view
@@ -112,6 +123,31 @@ class HardwareViewTestSuite(unittest.TestCase):
         for counter in filtered_view.iter_counters():
             self.assertNotEqual(counter.visibility, CVisibility.INTERNAL)
 
+    def test_filtering_3(self):
+        '''
+        Test the HardwareView identity filter returns a copy of the view.
+        '''
+        view = self.get_hw_view()
+        filtered_view = view.filter(CVisibility.INTERNAL, True)
+
+        self.assertIsNot(filtered_view, view)
+        self.assertEqual(filtered_view.stable_ids(), view.stable_ids())
+
+        # Changing the copy must not change the source view
+        filtered_view.clear()
+        self.assertTrue(view)
+
+    def test_bulk_accessors(self):
+        '''
+        Test the HardwareView bulk accessors match per-counter iteration.
+        '''
+        view = self.get_hw_view()
+        counters = list(view.iter_counters())
+
+        self.assertEqual(view.stable_ids(), [x.stable_id for x in counters])
+        self.assertEqual(view.machine_names(),
+                         [x.machine_name for x in counters])
+
 
 def main() -> int:
     '''
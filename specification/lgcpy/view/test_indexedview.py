@@ -43,40 +43,45 @@ class IndexedViewTestSuite(unittest.TestCase):
     Unit tests for the indexedview module.
     '''
 
+    pd_db: ProductInfos
+    hw_db: HardwareLayouts
+    ct_db: CounterInfos
+
+    @classmethod
+    def setUpClass(cls):
+        '''
+        Load the databases once for all tests in the suite.
+        '''
+        cls.pd_db = ProductInfos.from_file()
+        cls.hw_db = HardwareLayouts.from_files()
+        cls.ct_db = CounterInfos.from_files()
+
     def test_smoke(self):
         '''
         Test the IndexedView can compile in all variants.
         '''
-        pd_db = ProductInfos.from_file()
-        gpus = pd_db.get_gpus()
-
-        hw_db = HardwareLayouts.from_files()
-        ct_db = CounterInfos.from_files()
+        gpus = self.pd_db.get_gpus()
 
         for gpu in gpus:
-            pd_info = pd_db.get_gpu(gpu)
-            hw_info = hw_db.get_gpu(pd_info.database_key)
+            pd_info = self.pd_db.get_gpu(gpu)
+            hw_info = self.hw_db.get_gpu(pd_info.database_key)
 
             # Build the view
-            view = IndexedView.from_db(gpu, pd_info, hw_info, ct_db)
+            view = IndexedView.from_db(gpu, pd_info, hw_info, self.ct_db)
             self.assertIsNotNone(view)
 
     def test_equation_resolve(self):
         '''
         Test the IndexedView can resolve equations.
         '''
-        pd_db = ProductInfos.from_file()
-        gpus = pd_db.get_gpus()
-
-        hw_db = HardwareLayouts.from_files()
-        ct_db = CounterInfos.from_files()
+        gpus = self.pd_db.get_gpus()
 
         for gpu in gpus:
-            pd_info = pd_db.get_gpu(gpu)
-            hw_info = hw_db.get_gpu(pd_info.database_key)
+            pd_info = self.pd_db.get_gpu(gpu)
+            hw_info = self.hw_db.get_gpu(pd_info.database_key)
 
             # Build the view
-            view = IndexedView.from_db(gpu, pd_info, hw_info, ct_db)
+            view = IndexedView.from_db(gpu, pd_info, hw_info, self.ct_db)
             view.resolve_equations()
 
             count = len(view.by_stable_id)
@@ -86,26 +91,66 @@ class IndexedViewTestSuite(unittest.TestCase):
         '''
         Test the IndexedView can resolve equations.
         '''
-        pd_db = ProductInfos.from_file()
-        gpus = pd_db.get_gpus()
-
-        hw_db = HardwareLayouts.from_files()
-        ct_db = CounterInfos.from_files()
+        gpus = self.pd_db.get_gpus()
 
         for gpu in gpus:
-            pd_info = pd_db.get_gpu(gpu)
-            hw_info = hw_db.get_gpu(pd_info.database_key)
+            pd_info = self.pd_db.get_gpu(gpu)
+            hw_info = self.hw_db.get_gpu(pd_info.database_key)
 
             # Build the view - keeping Advanced counters should mean that
             # everything still resolves because public derivations should never
             # refer to Internal counters, so this is a good sanity check
-            view = IndexedView.from_db(gpu, pd_info, hw_info, ct_db)
+            view = IndexedView.from_db(gpu, pd_info, hw_info, self.ct_db)
             filtered_view = view.filter(CVisibility.ADVANCED_SYSTEM, True)
             filtered_view.resolve_equations()
 
             count = len(filtered_view.by_stable_id)
             print(f'Test filtered {gpu} has {count} counters')
 
+    def test_filter_cache(self):
+        '''
+        Test the IndexedView reuses filtered views for repeated filters.
+        '''
+        gpu = self.pd_db.get_gpus()[0]
+
+        pd_info = self.pd_db.get_gpu(gpu)
+        hw_info = self.hw_db.get_gpu(pd_info.database_key)
+
+        view = IndexedView.from_db(gpu, pd_info, hw_info, self.ct_db)
+        view_a = view.filter(CVisibility.ADVANCED_SYSTEM, True)
+        view_b = view.filter(CVisibility.ADVANCED_SYSTEM, True)
+        view_c = view.filter(CVisibility.ADVANCED_SYSTEM, False)
+
+        self.assertIs(view_a, view_b)
+        self.assertIsNot(view_a, view_c)
+
+        # Shared views have read-only indexes
+        counter = next(iter(view_c))
+        with self.assertRaises(TypeError):
+            view_a.by_stable_id[counter.stable_id] = counter
+
+    def test_select(self):
+        '''
+        Test the IndexedView selects the counters that pass the filter, in
+        database order.
+        '''
+        gpu = self.pd_db.get_gpus()[0]
+
+        pd_info = self.pd_db.get_gpu(gpu)
+        hw_info = self.hw_db.get_gpu(pd_info.database_key)
+
+        view = IndexedView.from_db(gpu, pd_info, hw_info, self.ct_db)
+        for visibility in CVisibility:
+            for derived in (True, False):
+                selected = view.select(visibility, derived)
+                expected = [
+                    x.stable_id for x in view.by_stable_id.values()
+                    if x.visibility.value <= visibility.value
+                    and (derived or not x.is_derived())]
+
+                # Selection must keep database order
+                self.assertEqual([x.stable_id for x in selected], expected)
+
 
 def main() -> int:
     '''
@@ -29,6 +29,7 @@ do not check the validity of the data in the counter info database.
 '''
 
 import sys
+from typing import Optional
 import unittest
 
 from ..data.productinfo import ProductInfos
@@ -49,61 +50,67 @@ class SemanticViewTestSuite(unittest.TestCase):
 
     REF_GPU = 'Mali-G710'
 
+    pd_db: ProductInfos
+    hw_db: HardwareLayouts
+    ct_db: CounterInfos
+    ref_view: Optional[SemanticView] = None
+    sem_db: SemanticLayout
+    sem_is_db: SemanticSectionInfos
+    sem_ig_db: SemanticGroupInfos
+
+    @classmethod
+    def setUpClass(cls):
+        '''
+        Load the databases once for all tests in the suite.
+        '''
+        cls.pd_db = ProductInfos.from_file()
+        cls.hw_db = HardwareLayouts.from_files()
+        cls.ct_db = CounterInfos.from_files()
+        cls.sem_db = SemanticLayout.from_file()
+        cls.sem_is_db = SemanticSectionInfos.from_file()
+        cls.sem_ig_db = SemanticGroupInfos.from_file()
+
     def get_sem_view(self) -> SemanticView:
         '''
         Get a standard SemView we can use for testing.
         '''
-        gpu = self.REF_GPU
+        if self.ref_view is not None:
+            return self.ref_view
 
-        pd_db = ProductInfos.from_file()
-        pd_info = pd_db.get_gpu(gpu)
-
-        hw_db = HardwareLayouts.from_files()
-        hw_info = hw_db.get_gpu(pd_info.database_key)
-
-        ct_db = CounterInfos.from_files()
+        gpu = self.REF_GPU
 
-        sem_db = SemanticLayout.from_file()
-        sem_is_db = SemanticSectionInfos.from_file()
-        sem_ig_db = SemanticGroupInfos.from_file()
+        pd_info = self.pd_db.get_gpu(gpu)
+        hw_info = self.hw_db.get_gpu(pd_info.database_key)
 
         # Build the base view
-        ct_view = IndexedView.from_db(gpu, pd_info, hw_info, ct_db)
+        ct_view = IndexedView.from_db(gpu, pd_info, hw_info, self.ct_db)
         self.assertIsNotNone(ct_view)
 
         # Build the structured view
         sem_view = SemanticView.from_db(
-            gpu, sem_db, sem_is_db, sem_ig_db, ct_view)
+            gpu, self.sem_db, self.sem_is_db, self.sem_ig_db, ct_view)
         self.assertIsNotNone(sem_view)
 
+        self.__class__.ref_view = sem_view
         return sem_view
 
     def test_smoke(self):
         '''
         Test the SemanticView can compile in all variants.
         '''
-        pd_db = ProductInfos.from_file()
-        gpus = pd_db.get_gpus()
-
-        hw_db = HardwareLayouts.from_files()
-
-        ct_db = CounterInfos.from_files()
-
-        sem_db = SemanticLayout.from_file()
-        sem_is_db = SemanticSectionInfos.from_file()
-        sem_ig_db = SemanticGroupInfos.from_file()
+        gpus = self.pd_db.get_gpus()
 
         for gpu in gpus:
-            pd_info = pd_db.get_gpu(gpu)
-            hw_info = hw_db.get_gpu(pd_info.database_key)
+            pd_info = self.pd_db.get_gpu(gpu)
+            hw_info = self.hw_db.get_gpu(pd_info.database_key)
 
             # Build the base view
-            ct_view = IndexedView.from_db(gpu, pd_info, hw_info, ct_db)
+            ct_view = IndexedView.from_db(gpu, pd_info, hw_info, self.ct_db)
             self.assertIsNotNone(ct_view)
 
             # Build the structured view
             sem_view = SemanticView.from_db(
-                gpu, sem_db, sem_is_db, sem_ig_db, ct_view)
+                gpu, self.sem_db, self.sem_is_db, self.sem_ig_db, ct_view)
             self.assertIsNotNone(sem_view)
 
     def test_filtering_1(self):
@@ -127,6 +134,22 @@ class SemanticViewTestSuite(unittest.TestCase):
         for counter in filtered_view.iter_counters():
             self.assertNotEqual(counter.visibility, CVisibility.INTERNAL)
 
+    def test_filtering_3(self):
+        '''
+        Test the SemanticView identity filter returns a copy of the view.
+        '''
+        view = self.get_sem_view()
+        filtered_view = view.filter(CVisibility.INTERNAL, True)
+
+        self.assertIsNot(filtered_view, view)
+        self.assertEqual(list(filtered_view.iter_counters()),
+                         list(view.iter_counters()))
+
+        # Shared sections are read-only
+        section = next(iter(view))
+        with self.assertRaises(TypeError):
+            filtered_view.sections[section.name] = section
+
 
 def main() -> int:
     '''
@@ -28,12 +28,26 @@ deserializing database entries to/from XML.
 
 from __future__ import annotations
 
-from xml.dom import minidom
+import functools
+import pathlib
 import re
 import textwrap
-from typing import Optional
+from typing import Optional, Union
 import xml.etree.ElementTree as et
 
+# Patterns for undoing multi-line pretty-printing in from_pretty_xml()
+_PRETTY_PARA_BREAK = re.compile(r'\n\n+')
+_PRETTY_BULLET_BREAK = re.compile(r'\n(?=\*)')
+_PRETTY_HYPHEN_BREAK = re.compile(r'(?<=\S-)\n(?:-\n)*')
+
+# Line boundaries recognized by str.splitlines() other than '\n'
+_OTHER_LINE_BREAKS = re.compile('[\r\v\f\x1c-\x1e\x85\u2028\u2029]')
+
+# Lines split as by str.splitlines(), with the line text in the first group
+_SPLIT_LINES = re.compile(
+    '(?=.)([^\n\r\v\f\x1c-\x1e\x85\u2028\u2029]*)'
+    '(?:\r\n|[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]|\\Z)', re.DOTALL)
+
 
 def add_copyright_to_xml_str(document: str, copyright_msg: str) -> str:
     '''
@@ -51,15 +65,29 @@ def add_copyright_to_xml_str(document: str, copyright_msg: str) -> str:
     Returns:
         Modified document with copyright added.
     '''
-    doc_lines = document.splitlines()
+    com_lines = ['<!--', *copyright_msg.splitlines(), '-->']
+    comment = '\n'.join(com_lines) + '\n'
 
-    com_lines = copyright_msg.splitlines()
-    com_lines.insert(0, '<!--')
-    com_lines.append('-->')
+    # Other line endings are normalized to '\n', which needs a full split
+    if _OTHER_LINE_BREAKS.search(document):
+        doc_lines = document.splitlines()
+        doc_lines[1:1] = com_lines
+        return '\n'.join(doc_lines) + '\n'
 
-    doc_lines = doc_lines[:1] + com_lines + doc_lines[1:]
+    if not document:
+        return comment
 
-    return '\n'.join(doc_lines) + '\n'
+    # Splice after the first line, without splitting the whole document
+    split = document.find('\n') + 1
+    if not split:
+        return f'{document}\n{comment}'
+
+    header = document[:split]
+    body = document[split:]
+    if body and not body.endswith('\n'):
+        body += '\n'
+
+    return header + comment + body
 
 
 def get_copyright_from_xml_str(document: str) -> str:
@@ -69,7 +97,8 @@ def get_copyright_from_xml_str(document: str) -> str:
     Assumes that the copyright is the first comment that is a child node of
     the document root.
 
-    We can't do this using ElementTree because it discards comments.
+    This uses a pull parser, as the ElementTree parser discards comments, and
+    the whole document is parsed so malformed documents are still rejected.
 
     Args:
         document: The XML file.
@@ -77,12 +106,21 @@ def get_copyright_from_xml_str(document: str) -> str:
     Returns:
         Multi-line copyright string.
     '''
-    xml = minidom.parseString(document)
-
-    # First comment in the XML must be the copyright message
-    for node in xml.childNodes:
-        if node.nodeType == node.COMMENT_NODE:
-            return node.data.strip()
+    parser = et.XMLPullParser(events=('start', 'end', 'comment'))
+    parser.feed(document)
+    parser.close()
+
+    # First document-level comment must be the copyright message
+    depth = 0
+    for event in parser.read_events():
+        if event[0] == 'start':
+            depth += 1
+        elif event[0] == 'end':
+            depth -= 1
+        elif depth == 0:
+            node = event[-1]
+            assert isinstance(node, et.Element)
+            return (node.text or '').strip()
 
     return ''
 
@@ -102,9 +140,10 @@ def get_copyright_from_yaml_str(document: str) -> str:
         Multi-line copyright string.
     '''
     copyright_msg: list[str] = []
-    lines = document.splitlines()
 
-    for line in lines:
+    # Walk lines on demand, as we only need the header of the document
+    for match in _SPLIT_LINES.finditer(document):
+        line = match.group(1)
         is_comment = line.startswith('#')
 
         # End the loop when we end the first comment
@@ -117,6 +156,32 @@ def get_copyright_from_yaml_str(document: str) -> str:
     return '\n'.join(copyright_msg)
 
 
+def write_file_if_changed(file_path: Union[str, pathlib.Path],
+                          data: str) -> bool:
+    '''
+    Write a text file, skipping the write if it already has this content.
+
+    Args:
+        file_path: File path of the data on disk.
+        data: New file content.
+
+    Returns:
+        True if the file was written, False if it was unchanged.
+    '''
+    # Compare without newline translation so CRLF files are normalized
+    try:
+        with open(file_path, 'r', encoding='utf-8', newline='') as handle:
+            if handle.read() == data:
+                return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+
+    with open(file_path, 'w', encoding='utf-8') as handle:
+        handle.write(data)
+
+    return True
+
+
 def get_node_str(root: et.Element[str], tag: str) -> str:
     '''
     Helper to get a known-to-exist string from a known-to-exist XML node.
@@ -181,6 +246,92 @@ def get_node_opt_int(root: et.Element[str], tag: str) -> Optional[int]:
     return int(result)
 
 
+def get_child_texts(root: et.Element[str]) -> dict[str, Optional[str]]:
+    '''
+    Helper to get the text of all direct children of an XML node.
+
+    This scans the children once, so is cheaper than repeated calls to
+    get_node_str() when reading many sibling nodes. If a tag occurs more than
+    once the first node is used, matching Element.find().
+
+    Args:
+        root: The root XML node to search.
+
+    Return:
+        The text of each child node, indexed by tag.
+    '''
+    return {x.tag: x.text for x in reversed(root)}
+
+
+def get_text_str(texts: dict[str, Optional[str]], tag: str) -> str:
+    '''
+    Helper to get a known-to-exist string from a child text map.
+
+    Args:
+        texts: The child text map from get_child_texts().
+        tag: The XML tag of the child.
+
+    Return:
+        The string value.
+    '''
+    result = texts.get(tag)
+    assert result is not None
+    return result
+
+
+def get_text_opt_str(texts: dict[str, Optional[str]],
+                     tag: str) -> Optional[str]:
+    '''
+    Helper to get an optional string from a child text map.
+
+    Args:
+        texts: The child text map from get_child_texts().
+        tag: The XML tag of the child.
+
+    Return:
+        The string value if the node exists, or None otherwise.
+    '''
+    if tag not in texts:
+        return None
+
+    result = texts[tag]
+    assert result is not None
+    return result
+
+
+def get_text_opt_int(texts: dict[str, Optional[str]],
+                     tag: str) -> Optional[int]:
+    '''
+    Helper to get an optional int from a child text map.
+
+    Args:
+        texts: The child text map from get_child_texts().
+        tag: The XML tag of the child.
+
+    Return:
+        The int value if the node exists, or None otherwise.
+    '''
+    result = get_text_opt_str(texts, tag)
+    if result is None:
+        return None
+
+    return int(result)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_text_wrapper(width: int) -> textwrap.TextWrapper:
+    '''
+    Get a reusable text wrapper for a given line width.
+
+    Args:
+        width: Number of characters per line.
+
+    Returns:
+        A text wrapper that does not break on hyphens.
+    '''
+    return textwrap.TextWrapper(width=width, break_on_hyphens=False)
+
+
 def _to_pretty_xml__form_blocks(data: str, indent: int,
                                 width: int) -> list[str]:
     '''
@@ -208,22 +359,21 @@ def _to_pretty_xml__form_blocks(data: str, indent: int,
     paras = data.splitlines()
     new_paras: list[str] = []
 
+    list_wrapper = _get_text_wrapper(width - indent - 2)
+    para_wrapper = _get_text_wrapper(width - indent)
+
     for para in paras:
         is_list = para.startswith('*')
 
         # List wrapping aligns on the first character after the bullet
         if is_list:
-            lines = textwrap.wrap(para,
-                                  break_on_hyphens=False,
-                                  width=width - indent - 2)
+            lines = list_wrapper.wrap(para)
 
             new_text = '\n  '.join(lines)
 
         # Else wrap at the start of the indent block.
         else:
-            lines = textwrap.wrap(para,
-                                  break_on_hyphens=False,
-                                  width=width - indent)
+            lines = para_wrapper.wrap(para)
 
             new_text = '\n'.join(lines)
 
@@ -267,6 +417,7 @@ def _to_pretty_xml__space_blocks(paras: list[str], indent: int) -> list[str]:
     return new_paras
 
 
+@functools.lru_cache(maxsize=4096)
 def to_pretty_xml(data: str, multiline: bool = False,
                   indent: int = 6, outdent: int = 4, width: int = 79) -> str:
     '''
@@ -293,6 +444,27 @@ def to_pretty_xml(data: str, multiline: bool = False,
     return f'\n{document}\n{" " * outdent}'
 
 
+def _from_pretty_xml__join_lines(data: str) -> str:
+    '''
+    Rejoin the word-wrapped lines of a single paragraph or bullet item.
+
+    Assumption here is that any non-space followed by a `-` at the end of a
+    line is a hyphen split, and should be merged with the next line. Lines
+    that are just a `-` after a hyphen split are merged as well.
+
+    Args:
+        data: The newline separated lines of the item.
+
+    Returns:
+        The item as a single line.
+    '''
+    if '-\n' in data:
+        data = _PRETTY_HYPHEN_BREAK.sub(lambda x: x[0].replace('\n', ''),
+                                        data)
+
+    return data.replace('\n', ' ')
+
+
 def from_pretty_xml(data: str, multiline: bool = False) -> str:
     '''
     Convert from a pretty-printed string to an internal representation.
@@ -310,51 +482,25 @@ def from_pretty_xml(data: str, multiline: bool = False) -> str:
         else it is a bullet list item. Any sequence of contiguous lines
         starting with '*' will form a single bullet list.
     '''
-    # Break into lines of text
-    lines = data.strip().splitlines()
+    data = data.strip()
 
     # Single line strings are just prefix padded - strip it.
     if not multiline:
+        lines = data.splitlines()
         assert len(lines) == 1
-        line = lines[0]
-        return line.strip()
+        return lines[0]
 
-    is_newline = 0  # Last saw a newline
-    is_text = 1  # Last saw a text paragraph
-    is_bullet = 2  # Last saw a bullet paragraph
-    status = is_newline
+    # Trim the indent from every line, leaving blank lines between paragraphs
+    text = '\n'.join([x.strip() for x in data.splitlines()])
 
     new_data: list[str] = []
 
-    for line in lines:
-        line = line.strip()
-        if line:
-            # If we last saw a newline start a new paragraph
-            if status == is_newline:
-                if line.startswith('*'):
-                    status = is_bullet
-                else:
-                    status = is_text
-                new_data.append(line)
-            # Elif we last saw a bullet is this a new bullet?
-            elif status == is_bullet and line.startswith('*'):
-                new_data.append(line)
-            # Else this is a more content for the last thing we saw
-            else:
-                spacing = ' '
-
-                # Are we reassembling across a hyphen split, instead of a
-                # whitespace split? Note - assumption here is that any
-                # non-space followed by a `-` is a hyphen and should be
-                # merged with the next line.
-                if len(new_data[-1]) >= 2:
-                    pattern = re.compile(r'^.*\S{1}-$')
-                    if pattern.match(new_data[-1]):
-                        spacing = ''
-
-                new_data[-1] += spacing + line
-
+    for para in _PRETTY_PARA_BREAK.split(text):
+        # Lines starting with '*' start a new item in a bullet list
+        if para[:1] == '*':
+            new_data.extend(_PRETTY_BULLET_BREAK.split(para))
         else:
-            status = is_newline
+            new_data.append(para)
 
-    return '\n'.join(new_data)
+    # Rejoin the word-wrapped lines of each item, merging across hyphen splits
+    return '\n'.join(_from_pretty_xml__join_lines(x) for x in new_data)
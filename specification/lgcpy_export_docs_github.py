@@ -28,8 +28,11 @@ can be published directly on GitHub.
 '''
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import datetime
+import os
 import pathlib
+import re
 import shutil
 import sys
 from typing import Optional
@@ -41,6 +44,27 @@ from lgcpy import CounterDatabase, CounterView, CounterVisibility, \
 import lgcpy.docutils as du
 import lgcpy.equationutils as eu
 
+# Prebuilt snippet for heading clipboard links
+TOOLTIP_CONFIG = 'data-bs-toggle="tooltip" ' \
+                 'data-bs-delay="400" ' \
+                 'data-bs-placement="right" ' \
+                 'title="Copy to clipboard"'
+
+ANCHOR_LINK = f' <span {TOOLTIP_CONFIG}>' \
+              '<a class="lgc-link-copy link-secondary">' \
+              '<i class="fa-solid fa-link"></i>' \
+              '</a>' \
+              '</span>'
+
+# Prebuilt progress bars, indexed by the number of completed bar steps
+PROGRESS_BARS = [('=' * x).ljust(20) for x in range(0, 21)]
+
+# Pattern to find placeholder tokens in an HTML template
+TEMPLATE_TOKEN_PATTERN = re.compile(r'{{(\w+)}}')
+
+# Pattern for template files that are generated rather than copied
+TEMPLATE_IGNORE_PATTERN = re.compile(r'index\.html|mali.*')
+
 
 def is_number(value) -> bool:
     '''
@@ -67,16 +91,13 @@ def show_progress(value: int, max_value: int) -> None:
     if not sys.stdout.isatty():
         return
 
-    progress_len = 20
-    progress_bar = [' ' for x in range(0, progress_len)]
+    progress_len = len(PROGRESS_BARS) - 1
 
     percent = (float(value) / float(max_value)) * 100.0
 
     current_len = int((float(value) / float(max_value)) * progress_len)
-    for i in range(0, current_len):
-        progress_bar[i] = '='
 
-    label = f'  [{"".join(progress_bar)}] {percent:0.1f}%'
+    label = f'  [{PROGRESS_BARS[current_len]}] {percent:0.1f}%'
     print(label, flush=True, end='\r')
 
 
@@ -95,65 +116,48 @@ def generate_file_name(gpu: str) -> str:
     return f'{name}_counter_reference.html'
 
 
-def get_section_class(section: SemanticSectionView) -> str:
+# Visibility kinds of a counter, used to select documentation classes
+VISIBILITY_NORMAL = 0
+VISIBILITY_ADVANCED_APP = 1
+VISIBILITY_ADVANCED_SYS = 2
+
+
+def get_series_visibility(series: CounterView) -> int:
     '''
-    Get the HTML class for a given section based on counters it contains.
+    Get the documentation visibility kind for a given counter.
 
     Args:
-        section: The section to scan.
+        series: The counter to classify.
 
     Returns:
-        HTML class snippet.
+        One of the VISIBILITY_* kinds.
     '''
-    any_normal = False
-    any_advanced_app = False
-    any_advanced_sys = False
-
-    for group in section:
-        for series in group:
-            if series.is_advanced_application():
-                any_advanced_app = True
-            elif series.is_advanced_system() or series.is_internal():
-                any_advanced_sys = True
-            else:
-                any_normal = True
+    if series.is_advanced_application():
+        return VISIBILITY_ADVANCED_APP
 
-    classes = ['lgc-section']
-    if any_advanced_app and not any_normal:
-        classes.append('lgc-advanced-app')
-    if any_advanced_sys and not any_normal:
-        classes.append('lgc-advanced-sys')
+    if series.is_advanced_system() or series.is_internal():
+        return VISIBILITY_ADVANCED_SYS
 
-    class_string = ' '.join(classes)
-    return f'class="{class_string}"'
+    return VISIBILITY_NORMAL
 
 
-def get_group_class(group: SemanticGroupView) -> str:
+def get_visibility_class(base_class: str, kinds: set[int]) -> str:
     '''
-    Get the HTML class for a given group based on counters it contains.
+    Get the HTML class for an element based on the counters it contains.
 
     Args:
-        group: The group to scan.
+        base_class: The base HTML class of the element.
+        kinds: The visibility kinds of all counters the element contains.
 
     Returns:
         HTML class snippet.
     '''
-    any_normal = False
-    any_advanced_app = False
-    any_advanced_sys = False
+    any_normal = VISIBILITY_NORMAL in kinds
 
-    for series in group:
-        if series.is_advanced_application():
-            any_advanced_app = True
-        elif series.is_advanced_system() or series.is_internal():
-            any_advanced_sys = True
-        else:
-            any_normal = True
-
-    classes = ['lgc-group']
-    if any_advanced_app and not any_normal:
+    classes = [base_class]
+    if VISIBILITY_ADVANCED_APP in kinds and not any_normal:
         classes.append('lgc-advanced-app')
-    if any_advanced_sys and not any_normal:
+    if VISIBILITY_ADVANCED_SYS in kinds and not any_normal:
         classes.append('lgc-advanced-sys')
 
     class_string = ' '.join(classes)
@@ -180,20 +184,17 @@ def get_series_class(series: CounterView) -> str:
     return f'class="{class_string}"'
 
 
-def generate_introduction_block(index_view: IndexedView) -> str:
+def generate_introduction_block(parts: list[str],
+                                index_view: IndexedView) -> None:
     '''
     Generate the HTML for a given group.
 
     Args:
+        parts: Page content to append HTML lines to.
         index_view: Index view to use for any symbol resolution.
-
-    Returns:
-        HTML snippet.
     '''
     a_info = CounterDatabase.get_architecture_info_for(index_view.gpu)
 
-    parts = []
-
     parts.append('<h2 id="s_introduction">Introduction</h2>')
 
     description = du.resolve_doc_to_hyperlink(
@@ -201,25 +202,20 @@ def generate_introduction_block(index_view: IndexedView) -> str:
 
     parts.append(du.to_html_string(description))
 
-    return '\n'.join(parts)
-
 
-def generate_section_block(index_view: IndexedView,
+def generate_section_block(parts: list[str],
+                           index_view: IndexedView,
                            section: SemanticSectionView,
-                           anchor_link: str) -> str:
+                           anchor_link: str) -> None:
     '''
     Generate the HTML for a given group.
 
     Args:
+        parts: Page content to append HTML lines to.
         index_view: Index view to use for any symbol resolution.
         section: Section to generate documentation for.
         anchor_link: Prebuilt snippet for clipboard links.
-
-    Returns:
-        HTML snippet.
     '''
-    parts = []
-
     hanchor = f'id="{section.get_anchor()}"'
     parts.append(f'<h2 {hanchor}>{section.name}{anchor_link}</h2>')
 
@@ -228,25 +224,20 @@ def generate_section_block(index_view: IndexedView,
 
     parts.append(du.to_html_string(description))
 
-    return '\n'.join(parts)
-
 
-def generate_group_block(index_view: IndexedView,
+def generate_group_block(parts: list[str],
+                         index_view: IndexedView,
                          group: SemanticGroupView,
-                         anchor_link: str) -> str:
+                         anchor_link: str) -> None:
     '''
     Generate the HTML for a given group.
 
     Args:
+        parts: Page content to append HTML lines to.
         index_view: Index view to use for any symbol resolution.
         group: Group to generate documentation for.
         anchor_link: Prebuilt snippet for clipboard links.
-
-    Returns:
-        HTML snippet.
     '''
-    parts = []
-
     hanchor = f'id="{group.get_anchor()}"'
     parts.append(f'<h3 {hanchor}>{group.name}{anchor_link}</h3>')
 
@@ -255,41 +246,58 @@ def generate_group_block(index_view: IndexedView,
 
     parts.append(du.to_html_string(description))
 
-    return '\n'.join(parts)
-
 
-def generate_series_block(index_view: IndexedView,
-                           counter: CounterView,
-                           anchor_link: str) -> str:
+def emit_lookup_name(parts: list[str], name: Optional[str],
+                     fmt: str, cls: str) -> None:
     '''
-    Generate the HTML for a given counter.
+    Emit the HTML for a counter lookup name.
 
     Args:
-        index_view: Index view to use for any symbol resolution.
-        counter: Counter to generate documentation for.
-        anchor_link: Prebuilt snippet for clipboard links.
+        parts: Page content to append HTML lines to.
+        name: The lookup name, or None if not available in this format.
+        fmt: The display name of the format.
+        cls: The HTML class suffix of the format.
+    '''
+    # Skip if name doesn't exist in this format
+    if not name:
+        return
 
-    Returns:
-        HTML snippet.
+    parts.append(f'<div class="lgc-equation-format-{cls}">\n'
+                 f'{fmt} name: <code>{name}</code>\n'
+                 '</div>')
+
+
+def emit_equation(parts: list[str], eqn: str, fmt: str, cls: str) -> None:
     '''
+    Emit the HTML for a counter derivation.
 
-    def emit_lookup_name(name: Optional[str], fmt: str, cls: str) -> None:
-        # Skip if name doesn't exist in this format
-        if not name:
-            return
+    Args:
+        parts: Page content to append HTML lines to.
+        eqn: The equation string.
+        fmt: The display name of the format.
+        cls: The HTML class suffix of the format.
+    '''
+    parts.append('<div><div class="lgc-equation">\n'
+                 f'<div class="lgc-equation-format-{cls}">\n'
+                 f'<p>{fmt} derivation:</p>\n'
+                 f'<pre><code>{eqn}</code></pre>\n'
+                 '</div>\n'
+                 '</div></div>')
 
-        parts.append(f'<div class="lgc-equation-format-{cls}">')
-        parts.append(f'{fmt} name: <code>{name}</code>')
-        parts.append('</div>')
 
-    def emit_equation(eqn: str, fmt: str, cls: str) -> None:
-        parts.append('<div><div class="lgc-equation">')
-        parts.append(f'<div class="lgc-equation-format-{cls}">')
-        parts.append(f'<p>{fmt} derivation:</p>')
-        parts.append(f'<pre><code>{eqn}</code></pre>')
-        parts.append('</div>')
-        parts.append('</div></div>')
+def generate_series_block(parts: list[str],
+                          index_view: IndexedView,
+                          counter: CounterView,
+                          anchor_link: str) -> None:
+    '''
+    Generate the HTML for a given counter.
 
+    Args:
+        parts: Page content to append HTML lines to.
+        index_view: Index view to use for any symbol resolution.
+        counter: Counter to generate documentation for.
+        anchor_link: Prebuilt snippet for clipboard links.
+    '''
     # Build resolved heading
     hanchor = f'id="{counter.get_anchor()}"'
     cname = counter.group_human_name
@@ -301,35 +309,108 @@ def generate_series_block(index_view: IndexedView,
 
     description = du.to_html_string(description)
 
-    parts = [
-        heading,
-        description
-    ]
+    parts.append(heading)
+    parts.append(description)
 
     # Build original lookup name
     lgc_name = counter.machine_name
-    emit_lookup_name(lgc_name, 'libGPUCounters', 'lgc')
+    emit_lookup_name(parts, lgc_name, 'libGPUCounters', 'lgc')
 
+    # Each expression is only built once, either as the Streamline lookup
+    # name for hardware counters or as the derivation for derived counters
     if not counter.is_derived():
         sl_name = eu.get_streamline_expression(index_view, counter)
-        emit_lookup_name(sl_name, 'Streamline', 'sl')
+        emit_lookup_name(parts, sl_name, 'Streamline', 'sl')
 
         hw_name = counter.source_name
-        emit_lookup_name(hw_name, 'Hardware', 'hw')
+        emit_lookup_name(parts, hw_name, 'Hardware', 'hw')
 
     # Build full derivation
-    if counter.is_derived():
+    else:
         # Get the AST expanded for the current GPU
         equation = eu.get_machine_name_expression(index_view, counter)
-        emit_equation(equation, 'libGPUCounters', 'lgc')
+        emit_equation(parts, equation, 'libGPUCounters', 'lgc')
 
         equation = eu.get_streamline_expression(index_view, counter)
-        emit_equation(equation, 'Streamline', 'sl')
+        emit_equation(parts, equation, 'Streamline', 'sl')
 
         equation = eu.get_source_name_expression(index_view, counter)
-        emit_equation(equation, 'Hardware', 'hw')
+        emit_equation(parts, equation, 'Hardware', 'hw')
+
+
+def generate_group_content(parts: list[str],
+                           index_view: IndexedView,
+                           group: SemanticGroupView) -> set[int]:
+    '''
+    Generate the HTML for a given group and all of its counters.
+
+    The group class depends on the counters it contains, so the group start
+    is patched once its counters have been rendered.
+
+    Args:
+        parts: Page content to append HTML lines to.
+        index_view: Index view to use for any symbol resolution.
+        group: Group to generate documentation for.
+
+    Returns:
+        The visibility kinds of all counters in the group.
+    '''
+    # Start group
+    group_start = len(parts)
+    group_kinds: set[int] = set()
+    parts.append('')
+
+    generate_group_block(parts, index_view, group, ANCHOR_LINK)
+
+    for series in group:
+        group_kinds.add(get_series_visibility(series))
 
-    return '\n'.join(parts)
+        # Start series
+        parts.append(f'<div {get_series_class(series)}>')
+
+        generate_series_block(parts, index_view, series, ANCHOR_LINK)
+
+        # Stop series
+        parts.append('</div>')
+
+    # Stop group
+    parts.append('</div>')
+
+    group_class = get_visibility_class('lgc-group', group_kinds)
+    parts[group_start] = f'<div {group_class}>'
+
+    return group_kinds
+
+
+def generate_section_content(parts: list[str],
+                             index_view: IndexedView,
+                             section: SemanticSectionView) -> None:
+    '''
+    Generate the HTML for a given section and all of its groups.
+
+    The section class depends on the counters it contains, so the section
+    start is patched once its groups have been rendered.
+
+    Args:
+        parts: Page content to append HTML lines to.
+        index_view: Index view to use for any symbol resolution.
+        section: Section to generate documentation for.
+    '''
+    # Start section
+    section_start = len(parts)
+    section_kinds: set[int] = set()
+    parts.append('')
+
+    generate_section_block(parts, index_view, section, ANCHOR_LINK)
+
+    for group in section:
+        section_kinds |= generate_group_content(parts, index_view, group)
+
+    # Stop section
+    parts.append('</div>')
+
+    section_class = get_visibility_class('lgc-section', section_kinds)
+    parts[section_start] = f'<div {section_class}>'
 
 
 def generate_index_payload(gpus: list[str]) -> dict[str, list[list[str]]]:
@@ -371,16 +452,37 @@ def generate_index_payload(gpus: list[str]) -> dict[str, list[list[str]]]:
             if product.project_name:
                 project_name = product.project_name.title()
 
-            arch_products[arch].insert(
-                0, [arch,
-                    str(product.release_year),
-                    alias,
-                    project_name,
-                    generate_file_name(product.database_key)])
+            arch_products[arch].append(
+                [arch,
+                 str(product.release_year),
+                 alias,
+                 project_name,
+                 generate_file_name(product.database_key)])
+
+    # Products are presented in reverse order of the input GPU list
+    for product_list in arch_products.values():
+        product_list.reverse()
 
     return arch_products
 
 
+def populate_template(document: str, values: dict[str, str]) -> str:
+    '''
+    Replace placeholder tokens in a template in a single pass.
+
+    Tokens that have no value are left in the document unchanged.
+
+    Args:
+        document: The template text.
+        values: Map of replacement values, indexed by token name.
+
+    Returns:
+        The populated template.
+    '''
+    return TEMPLATE_TOKEN_PATTERN.sub(
+        lambda x: values.get(x[1], x[0]), document)
+
+
 def generate_counter_index(out_dir: pathlib.Path,
                            gpus: list[str],
                            add_codenames: bool) -> None:
@@ -452,11 +554,10 @@ def generate_counter_index(out_dir: pathlib.Path,
     page_content.append('</table>')
 
     # Populate template
-    document = document.replace('{{COPYRIGHT_YEAR}}',
-                                str(datetime.date.today().year))
-
-    document = document.replace('{{PAGE_CONTENT}}',
-                                '\n'.join(page_content))
+    document = populate_template(document, {
+        'COPYRIGHT_YEAR': str(datetime.date.today().year),
+        'PAGE_CONTENT': '\n'.join(page_content)
+    })
 
     # Save populated template
     file_name = out_dir / 'index.html'
@@ -465,19 +566,21 @@ def generate_counter_index(out_dir: pathlib.Path,
 
 
 def populate_counter_reference_template(
-        template_dir: pathlib.Path, product: ProductInfo, page_content: str,
-        release: bool) -> str:
+        template_dir: pathlib.Path, product: ProductInfo,
+        release: bool) -> tuple[str, str]:
     '''
-    Populate a text template with document content.
+    Populate a text template with everything except the document content.
+
+    The template is split around the page content, so the large content
+    string is written out directly rather than copied into the template.
 
     Args:
         template_dir: The directory containing the template file.
         product: The GPU we are generate the document for.
-        page_content: The page content to inject.
         release: Is this a release build or an internal build?
 
     Returns:
-        The populated template.
+        The populated template before and after the page content.
     '''
     file_name = template_dir / 'gpu_template.html'
     with open(file_name, encoding='utf-8') as handle:
@@ -494,28 +597,21 @@ def populate_counter_reference_template(
     gpu_name_tm = gpu_name.replace('Mali', 'Mali™')
     gpu_name_tm = gpu_name_tm.replace('Immortalis', 'Immortalis™')
 
-    document = document.replace('{{CONFIDENTIAL}}',
-                                '' if release else 'CONFIDENTIAL ')
-
-    document = document.replace('{{GPU_NAME_FULL}}',
-                                gpu_name_full)
-
-    document = document.replace('{{GPU_NAME_TM}}',
-                                gpu_name_tm)
+    # Page content is left in place, so the template can be split around it
+    document = populate_template(document, {
+        'CONFIDENTIAL': '' if release else 'CONFIDENTIAL ',
+        'GPU_NAME_FULL': gpu_name_full,
+        'GPU_NAME_TM': gpu_name_tm,
+        'GPU_NAME': gpu_name,
+        'COPYRIGHT_YEAR': str(datetime.date.today().year)
+    })
 
-    document = document.replace('{{GPU_NAME}}',
-                                gpu_name)
-
-    document = document.replace('{{COPYRIGHT_YEAR}}',
-                                str(datetime.date.today().year))
-
-    document = document.replace('{{PAGE_CONTENT}}',
-                                page_content)
+    prefix, suffix = document.split('{{PAGE_CONTENT}}')
 
     # Check all references have been replaced
-    assert '{{' not in document
+    assert '{{' not in prefix and '{{' not in suffix
 
-    return document
+    return prefix, suffix
 
 
 def generate_counter_reference(out_dir: pathlib.Path,
@@ -541,69 +637,34 @@ def generate_counter_reference(out_dir: pathlib.Path,
     if release:
         sem_view = sem_view.filter(CounterVisibility.ADVANCED_SYSTEM, True)
 
-    page_content = []
+    # Blocks append lines directly to the page, which is joined once
+    page_content: list[str] = []
     page_content.append('<div class="lgc-section">')
 
-    page_content.append(
-        generate_introduction_block(index_view)
-    )
+    generate_introduction_block(page_content, index_view)
 
     page_content.append('</div>')
 
-    tooltip_config = 'data-bs-toggle="tooltip" ' \
-                     'data-bs-delay="400" ' \
-                     'data-bs-placement="right" ' \
-                     'title="Copy to clipboard"'
-
-    anchor_link = f' <span {tooltip_config}>' \
-                  '<a class="lgc-link-copy link-secondary">' \
-                  '<i class="fa-solid fa-link"></i>' \
-                  '</a>' \
-                  '</span>'
-
     for section in sem_view:
-        # Start section
-        page_content.append(f'<div {get_section_class(section)}>')
-
-        page_content.append(
-            generate_section_block(index_view, section, anchor_link)
-        )
-
-        for group in section:
-            # Start group
-            page_content.append(f'<div {get_group_class(group)}>')
-
-            page_content.append(
-                generate_group_block(index_view, group, anchor_link)
-            )
-
-            for series in group:
-                # Start series
-                page_content.append(f'<div {get_series_class(series)}>')
-
-                page_content.append(
-                    generate_series_block(index_view, series, anchor_link)
-                )
-
-                # Stop series
-                page_content.append('</div>')
-
-            # Stop group
-            page_content.append('</div>')
-
-        # Stop section
-        page_content.append('</div>')
+        generate_section_content(page_content, index_view, section)
 
     # Products that disallow documents should be stopped earlier
     document_name = product.get_document_name()
     assert document_name
 
-    document = populate_counter_reference_template(
-        out_dir, product, '\n'.join(page_content), release)
+    prefix, suffix = populate_counter_reference_template(
+        out_dir, product, release)
+
+    document = '\n'.join(page_content)
+
+    # Check all references in the content have been resolved
+    assert '{{' not in document
 
     file_name = out_dir / generate_file_name(document_name)
     with open(file_name, 'w', encoding='utf-8') as handle:
+        handle.write(prefix)
         handle.write(document)
+        handle.write(suffix)
 
 
 def is_enabled(args, gpu):
@@ -667,16 +728,34 @@ def parse_cli() -> argparse.Namespace:
         '--overwrite', action='store_true', default=False,
         help='delete all existing content in the output directory')
 
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=os.cpu_count() or 1,
+        help='number of GPU documents to generate in parallel')
+
     args = parser.parse_args()
 
-    if not args.gpu:
-        args.gpu = choices1
+    # Selected GPUs are only used for membership tests
+    args.gpu = frozenset(args.gpu or choices1)
 
     args.output = pathlib.Path(args.output)
 
     return args
 
 
+def get_ignored_template_files(_: str, names: list[str]) -> list[str]:
+    '''
+    Get the documentation template files that should not be copied.
+
+    Args:
+        _: The directory being copied.
+        names: The file names in the directory.
+
+    Returns:
+        The file names to ignore.
+    '''
+    return [x for x in names if TEMPLATE_IGNORE_PATTERN.fullmatch(x)]
+
+
 def main() -> int:
     '''
     The main function.
@@ -718,17 +797,27 @@ def main() -> int:
     else:
         assert False, 'ERROR: No documentation template directory found'
 
-    ignore = ['index.html', 'mali*']
     shutil.copytree(docs_template_dir, args.output,
-                    ignore=shutil.ignore_patterns(*ignore))
+                    ignore=get_ignored_template_files)
 
     # Generate index documentation
     generate_counter_index(args.output, gpu_list, not args.release)
 
-    # Generate per-GPU documentation
-    for i, gpu in enumerate(gpu_list):
-        generate_counter_reference(args.output, gpu, args.release)
-        show_progress(i + 1, len(gpu_list))
+    # Generate per-GPU documentation, which is independent for each GPU
+    if args.jobs > 1 and len(gpu_list) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            futures = [
+                pool.submit(generate_counter_reference,
+                            args.output, gpu, args.release)
+                for gpu in gpu_list]
+
+            for i, future in enumerate(as_completed(futures)):
+                future.result()
+                show_progress(i + 1, len(gpu_list))
+    else:
+        for i, gpu in enumerate(gpu_list):
+            generate_counter_reference(args.output, gpu, args.release)
+            show_progress(i + 1, len(gpu_list))
     print('\n')
 
     return 0
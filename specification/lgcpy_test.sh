@@ -48,3 +48,6 @@ printf "Running interface tests\n"
 printf "= = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = \n"
 printf "\n"
 python3 -m lgcpy.test_database
+python3 -m lgcpy.test_docutils
+python3 -m lgcpy.test_equationutils
+python3 -m lgcpy.test_xmlutils
@@ -63,7 +63,11 @@ the files back to disk for human review:
 
 import argparse
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
 import enum
+import io
+import os
 import re
 import sys
 import textwrap
@@ -73,6 +77,54 @@ from lgcpy.data.counterinfo import CounterInfo
 from lgcpy.data.hardwarelayout import HardwareBlockType as HWBlock
 
 
+# Pattern to find symbolic references in a document
+REFERENCE_PATTERN = re.compile(r'{{(.*?)}}')
+
+# Pattern to find any pre/post or double space whitespace in a string
+WHITESPACE_PATTERN = re.compile(r'^\s|\s$|  ')
+
+# Units that counters are allowed to use
+VALID_UNITS = frozenset((
+    # Standard units
+    'percent',
+    # Usage
+    'beats',
+    'cycles',
+    'issues',
+    # Sizes
+    'bits',
+    'bytes',
+    # Rates
+    'bytes/second',
+    # Things
+    'boxes',
+    'blocks',
+    'instances',
+    'instructions',
+    'interrupts',
+    'jobs',
+    'pixels',
+    'primitives',
+    'quads',
+    'requests',
+    'tasks',
+    'tests',
+    'tiles',
+    'threads',
+    'transactions',
+    'warps',
+    'batches',
+    'nodes',
+    'triangles',
+    'rays',
+))
+
+# Constants that documentation references are allowed to use
+VALID_REFERENCE_CONSTANTS = frozenset(('GPU_NAME', ))
+
+# Counter parts that documentation references are allowed to use
+VALID_REFERENCE_PARTS = frozenset(('', 'equation'))
+
 # Test functions will use internal class functions to access raw databases
 # pylint: disable=protected-access
 
@@ -138,6 +190,39 @@ def print_err_gcd(reason: str, detail: str, gpu: str, counter: str) -> None:
     print(f'FAIL: {gpu}.{counter}: {reason} [{detail}]')
 
 
+def validate_whitespace_fields(fields: dict[str, str], source: str,
+                               name: str) -> int:
+    '''
+    Validate whitespace consistency for the text fields of one entry.
+
+    Args:
+        fields: Map of field values, indexed by human readable field name.
+        source: Database entry type we're validating.
+        name: Name of the entry we're validating.
+
+    Returns:
+        The number of errors discovered.
+    '''
+    errors = 0
+
+    for field, value in fields.items():
+        # Most fields are clean, so classify only after a single scan
+        if not WHITESPACE_PATTERN.search(value):
+            continue
+
+        if value != value.strip():
+            reason = f'Pre/post whitespace in {source}'
+            print_err_cd(reason, field, name)
+            errors += 1
+
+        if '  ' in value:
+            reason = f'Double whitespace in {source}'
+            print_err_cd(reason, field, name)
+            errors += 1
+
+    return errors
+
+
 def validate_whitespace() -> int:
     '''
     Validate whitespace consistency.
@@ -153,8 +238,6 @@ def validate_whitespace() -> int:
     assert cnt_db is not None
 
     for counter in cnt_db:
-        cname = counter.machine_name
-
         fields = {
             'Machine name': counter.machine_name,
             'Source name': counter.source_name if counter.source_name else '',
@@ -165,60 +248,32 @@ def validate_whitespace() -> int:
             'Long description': counter.long_description
         }
 
-        for field, value in fields.items():
-            if value != value.strip():
-                reason = 'Pre/post whitespace in CounterInfo'
-                print_err_cd(reason, field, cname)
-                errors += 1
-
-            if '  ' in field:
-                reason = 'Double whitespace in CounterInfo'
-                print_err_cd(reason, field, cname)
-                errors += 1
+        errors += validate_whitespace_fields(
+            fields, 'CounterInfo', counter.machine_name)
 
     si_db = CounterDatabase.g_semantic_section_info_db
     assert si_db
 
     for section in si_db:
-        name = section.name
-
         fields = {
             'Name': section.name,
             'Long description': section.long_description
         }
 
-        for field, value in fields.items():
-            if value != value.strip():
-                reason = 'Pre/post whitespace in SemanticSectionInfo'
-                print_err_cd(reason, field, name)
-                errors += 1
-
-            if '  ' in value:
-                reason = 'Double whitespace in SemanticSectionInfo'
-                print_err_cd(reason, field, name)
-                errors += 1
+        errors += validate_whitespace_fields(
+            fields, 'SemanticSectionInfo', section.name)
 
     gr_db = CounterDatabase.g_semantic_group_info_db
     assert gr_db
 
     for group in gr_db:
-        name = group.name
-
         fields = {
             'Name': group.name,
             'Long description': group.long_description
         }
 
-        for field, value in fields.items():
-            if value != value.strip():
-                reason = 'Pre/post whitespace in SemanticGroupInfo'
-                print_err_cd(reason, field, name)
-                errors += 1
-
-            if '  ' in value:
-                reason = 'Double whitespace in SemanticGroupInfo'
-                print_err_cd(reason, field, name)
-                errors += 1
+        errors += validate_whitespace_fields(
+            fields, 'SemanticGroupInfo', group.name)
 
     return errors
 
@@ -245,6 +300,10 @@ def validate_absence_of_resolves() -> int:
             'Short description': counter.short_description,
         }
 
+        # Most counters are clean, so only check fields after a single scan
+        if '{{' not in ''.join(fields.values()):
+            continue
+
         for field, value in fields.items():
             if '{{' in value:
                 reason = 'Counter reference in CounterInfo'
@@ -350,13 +409,10 @@ def validate_stable_ids() -> int:
 
     # Propose Stable IDs for entries missing them, this patches the database
     # in-place so we can write the suggested values back to file automatically
-    def get_unassigned_id() -> int:
-        for i in range(0, max(found_ids.keys()) + 2):
-            if i not in found_ids:
-                return i
-
-        # Should never hit this
-        return 0
+    # Free IDs are handed out in ascending order from a cursor that only
+    # moves forwards, recording each one so it is never proposed twice
+    used_ids = set(found_ids)
+    next_id = 0
 
     for machine_name, counters in missing_ids.items():
         # Later counter with the same name assigned an ID
@@ -364,7 +420,11 @@ def validate_stable_ids() -> int:
             stable_id = found_names[machine_name].stable_id
         # Else we need a new one
         else:
-            stable_id = get_unassigned_id()
+            while next_id in used_ids:
+                next_id += 1
+
+            stable_id = next_id
+            used_ids.add(next_id)
 
         for counter in counters:
             counter.stable_id = stable_id
@@ -377,6 +437,32 @@ def validate_stable_ids() -> int:
     return errors
 
 
+class SemanticGroupUsage:
+    '''
+    Usage of a single semantic layout group by the counter database.
+
+    Attributes:
+        section: Name of the parent section.
+        count: Number of counters in the group.
+        sl_names: Counter names listed in the semantic layout.
+        cnt_names: Counter names found in the counter database.
+    '''
+
+    __slots__ = ('section', 'count', 'sl_names', 'cnt_names')
+
+    def __init__(self, section: str):
+        '''
+        Construct a new empty group usage.
+
+        Args:
+            section: Name of the parent section.
+        '''
+        self.section = section
+        self.count = 0
+        self.sl_names: set[str] = set()
+        self.cnt_names: set[str] = set()
+
+
 def validate_semantic_layout() -> int:
     '''
     Validate semantic layout consistency.
@@ -403,7 +489,7 @@ def validate_semantic_layout() -> int:
     errors = 0
 
     seen_sections: dict[str, int] = {}
-    seen_groups: dict[str, list] = {}
+    seen_groups: dict[str, SemanticGroupUsage] = {}
 
     # Check for uniqueness
     for section in sl_db:
@@ -426,41 +512,38 @@ def validate_semantic_layout() -> int:
                 print_err_c(reason, gname)
                 errors += 1
 
-            seen_groups[gname] = [sname, 0, [], []]
-            group_counters = seen_groups[gname][2]
+            group_usage = SemanticGroupUsage(sname)
+            seen_groups[gname] = group_usage
 
             for counters in group:
                 cname = counters.name
 
                 # This is caught using load-time asserts currently
-                if cname in group_counters:
+                if cname in group_usage.sl_names:
                     reason = 'Duplicate counter in SemanticLayout'
                     print_err_c(reason, f'{gname}.{cname}')
                     errors += 1
-
-                group_counters.append(cname)
+                else:
+                    group_usage.sl_names.add(cname)
 
     # Stop checking if we've had errors already because they snowball
     if errors != 0:
         return errors
 
     # Check all counters have a group
-    cnt_db = CounterDatabase.g_counter_info_db
-    assert cnt_db is not None
-
     for counter in cnt_db:
         gname = counter.group_name
+        usage = seen_groups.get(gname)
 
-        if gname not in seen_groups:
+        if usage is None:
             reason = 'Missing group in SemanticLayout'
             print_err_c(reason, gname)
             errors += 1
             continue
 
-        sname = seen_groups[gname][0]
-        seen_groups[gname][1] += 1
-        seen_groups[gname][3].append(counter.group_human_name)
-        seen_sections[sname] += 1
+        usage.count += 1
+        usage.cnt_names.add(counter.group_human_name)
+        seen_sections[usage.section] += 1
 
     # Check all sections/groups have counters
     for sname, count in seen_sections.items():
@@ -470,28 +553,25 @@ def validate_semantic_layout() -> int:
             print_err_c(reason, sname)
             errors += 1
 
-    for gname, (sname, count, sl_names, cnt_names) in seen_groups.items():
+    for gname, group_usage in seen_groups.items():
         # Detect groups with no counters
-        if count == 0:
+        if group_usage.count == 0:
             reason = 'Extra group in SemanticLayout'
             print_err_c(reason, gname)
             errors += 1
 
         # Detect extra counters in either direction
-        sl_set = set(x for x in sl_names)
-        cnt_set = set(x for x in cnt_names)
+        sl_only = group_usage.sl_names.difference(group_usage.cnt_names)
+        cnt_only = group_usage.cnt_names.difference(group_usage.sl_names)
 
-        sl_only = sl_set.difference(cnt_set)
-        cnt_only = cnt_set.difference(sl_set)
-
-        for counter in sl_only:
+        for cname in sl_only:
             reason = 'Extra semantic counter in SemanticLayout'
-            print_err_c(reason, f'{gname}.{counter}')
+            print_err_c(reason, f'{gname}.{cname}')
             errors += 1
 
-        for counter in cnt_only:
+        for cname in cnt_only:
             reason = 'Extra semantic counter in CounterInfo'
-            print_err_c(reason, f'{gname}.{counter}')
+            print_err_c(reason, f'{gname}.{cname}')
             errors += 1
 
     return errors
@@ -516,8 +596,8 @@ def validate_semantic_info() -> int:
     errors = 0
 
     # Check sections
-    layout_s = set(x.name for x in sl_db.iter_sections())
-    info_s = set(x.name for x in sl_sdb)
+    layout_s = {x.name for x in sl_db.iter_sections()}
+    info_s = {x.name for x in sl_sdb}
 
     extra_info = info_s - layout_s
     for name in extra_info:
@@ -526,8 +606,8 @@ def validate_semantic_info() -> int:
         errors += 1
 
     # Check groups
-    layout_g = set(x.name for x in sl_db.iter_groups())
-    info_g = set(x.name for x in sl_gdb)
+    layout_g = {x.name for x in sl_db.iter_groups()}
+    info_g = {x.name for x in sl_gdb}
 
     extra_info = info_g - layout_g
     for name in extra_info:
@@ -548,7 +628,7 @@ def validate_gpu_fields() -> int:
         The number of errors discovered.
     '''
     errors = 0
-    keys = set(x for x in CounterDatabase.get_supported_database_keys())
+    keys = set(CounterDatabase.get_supported_database_keys())
 
     cnt_db = CounterDatabase.g_counter_info_db
     assert cnt_db
@@ -606,43 +686,8 @@ def validate_units_fields() -> int:
 
     errors = 0
 
-    valid_units = set((
-        # Standard units
-        'percent',
-        # Usage
-        'beats',
-        'cycles',
-        'issues',
-        # Sizes
-        'bits',
-        'bytes',
-        # Rates
-        'bytes/second',
-        # Things
-        'boxes',
-        'blocks',
-        'instances',
-        'instructions',
-        'interrupts',
-        'jobs',
-        'pixels',
-        'primitives',
-        'quads',
-        'requests',
-        'tasks',
-        'tests',
-        'tiles',
-        'threads',
-        'transactions',
-        'warps',
-        'batches',
-        'nodes',
-        'triangles',
-        'rays',
-    ))
-
     for counter in cnt_db:
-        if counter.units not in valid_units:
+        if counter.units not in VALID_UNITS:
             cname = counter.machine_name
             reason = 'Bad units for CounterInfo'
             print_err_cd(reason, counter.units, cname)
@@ -695,55 +740,37 @@ def validate_name_uniqueness(gpu: str) -> int:
 
     errors = 0
 
-    found_source_names = set()
-    found_machine_names = set()
-    found_human_names = set()
-    found_group_names = set()
+    # Names found so far, tagged by the kind of name they are
+    found_names: set[tuple[str, str]] = set()
 
     for counter in cnt_db:
         if not counter.supports_gpu(gpu):
             continue
 
-        # Check source name
-        if counter.source_name in found_source_names:
-            if not counter.source_name:
-                continue
-
-            reason = 'Duplicate SourceName'
-            print_err_gc(reason, gpu, counter.source_name)
-            errors += 1
-
-        found_source_names.add(counter.source_name)
-
-        # Check machine name
-        if counter.machine_name in found_machine_names:
-            reason = 'Duplicate MachineName'
-            print_err_gc(reason, gpu, counter.machine_name)
-            errors += 1
-
-        found_machine_names.add(counter.machine_name)
+        group_name = f'{counter.group_name}.{counter.group_human_name}'
 
-        # Check human name
-        if counter.human_name in found_human_names:
-            reason = 'Duplicate HumanName'
-            print_err_gc(reason, gpu, counter.human_name)
-            errors += 1
+        names = [
+            ('MachineName', counter.machine_name),
+            ('HumanName', counter.human_name),
+            ('GroupName/GroupHumanName', group_name)
+        ]
 
-        found_human_names.add(counter.human_name)
+        # Source name is optional, and many counters may omit it
+        if counter.source_name:
+            names.insert(0, ('SourceName', counter.source_name))
 
-        # Check human group name
-        group_name = f'{counter.group_name}.{counter.group_human_name}'
-        if group_name in found_group_names:
-            reason = 'Duplicate GroupName/GroupHumanName'
-            print_err_gc(reason, gpu, group_name)
-            errors += 1
-
-        found_group_names.add(group_name)
+        for name in names:
+            if name in found_names:
+                reason = f'Duplicate {name[0]}'
+                print_err_gc(reason, gpu, name[1])
+                errors += 1
+            else:
+                found_names.add(name)
 
     return errors
 
 
-def validate_source_name_consistency(gpu: str) -> int:
+def validate_source_name_consistency(cnt_db: IndexedView, gpu: str) -> int:
     '''
     Validate SourceName consistency.
 
@@ -754,6 +781,7 @@ def validate_source_name_consistency(gpu: str) -> int:
     databases, but the consistency check must still pass.
 
     Args:
+        cnt_db: Indexed view of the GPU to check.
         gpu: GPU database key to check.
 
     Returns:
@@ -762,12 +790,10 @@ def validate_source_name_consistency(gpu: str) -> int:
     assert CounterDatabase.g_hardware_layout_db
     hw_db = CounterDatabase.g_hardware_layout_db.get_gpu(gpu)
 
-    cnt_db = CounterDatabase.get_indexed_view_for(gpu)
-
     errors = 0
 
-    hw_source_names = set(x.name for x in hw_db.iter_counters())
-    cnt_source_names = set(x.source_name for x in cnt_db if x.source_name)
+    hw_source_names = {x.name for x in hw_db.iter_counters()}
+    cnt_source_names = {x.source_name for x in cnt_db if x.source_name}
 
     hw_only = hw_source_names.difference(cnt_source_names)
     cnt_only = cnt_source_names.difference(hw_source_names)
@@ -785,18 +811,17 @@ def validate_source_name_consistency(gpu: str) -> int:
     return errors
 
 
-def validate_derived_equation_resolve(gpu: str) -> int:
+def validate_derived_equation_resolve(cnt_db: IndexedView, gpu: str) -> int:
     '''
     Validate derived equations can resolve.
 
     Args:
+        cnt_db: Indexed view of the GPU to check.
         gpu: GPU database key to check.
 
     Returns:
         The number of errors discovered.
     '''
-    cnt_db = CounterDatabase.get_indexed_view_for(gpu)
-
     errors = 0
 
     # Detect counters where AST compilation failed
@@ -816,16 +841,47 @@ def validate_derived_equation_resolve(gpu: str) -> int:
     return errors
 
 
-class Domain(enum.Enum):
+class Domain(enum.IntEnum):
     '''
     Cardinality domains with varying instance count.
-    '''
-    GPU = 'GPU'
-    MEM = 'MEM'
-    SC = 'SC'
-
 
-def validate_derived_equation_cardinality(gpu: str) -> int:
+    Integer values keep hashing cheap in the per-node domain sets.
+    '''
+    GPU = 0
+    MEM = 1
+    SC = 2
+
+
+# Mapping of counter blocks to implementation domains
+# Each domain can have an independent instance count in any product config
+CARDINALITY_DOMAINS = {
+    HWBlock.GPU_FRONTEND: Domain.GPU,
+    HWBlock.TILER: Domain.GPU,
+    HWBlock.MEMORY_SYSTEM: Domain.MEM,
+    HWBlock.SHADER_CORE: Domain.SC,
+}
+
+# Recognized domain scaling factors
+CARDINALITY_SCALING_CONSTANTS = {
+    'MALI_CONFIG_L2_CACHE_COUNT': Domain.MEM,
+    'MALI_CONFIG_SHADER_CORE_COUNT': Domain.SC,
+}
+
+# Other constants we can ignore
+CARDINALITY_OTHER_CONSTANTS = frozenset((
+    'MALI_CONFIG_TIME_SPAN',
+    'MALI_CONFIG_EXT_BUS_BYTE_SIZE'
+))
+
+# Manually reviewed exceptions
+CARDINALITY_EXCEPTIONS = frozenset((
+    'MaliFragOverdraw',
+    'MaliSCBusTileWrBPerPx'
+))
+
+
+def validate_derived_equation_cardinality(cnt_db: IndexedView,
+                                          gpu: str) -> int:
     '''
     Validate that multiblock equations have use appropriate scaling factors.
 
@@ -843,41 +899,16 @@ def validate_derived_equation_cardinality(gpu: str) -> int:
     factor is used correctly! Human review is still needed.
 
     Args:
+        cnt_db: Indexed view of the GPU to check.
         gpu: GPU to check.
 
     Returns:
         The number of errors discovered.
     '''
-    cnt_db = CounterDatabase.get_indexed_view_for(gpu)
-
     errors = 0
 
-    # Mapping of counter blocks to implementation domains
-    # Each domain can have an independent instance count in any product config
-    domains = {
-        HWBlock.GPU_FRONTEND: Domain.GPU,
-        HWBlock.TILER: Domain.GPU,
-        HWBlock.MEMORY_SYSTEM: Domain.MEM,
-        HWBlock.SHADER_CORE: Domain.SC,
-    }
-
-    # Recognized domain scaling factors
-    scaling_constants = {
-        'MALI_CONFIG_L2_CACHE_COUNT': Domain.MEM,
-        'MALI_CONFIG_SHADER_CORE_COUNT': Domain.SC,
-    }
-
-    # Other constants we can ignore
-    other_constants = (
-        'MALI_CONFIG_TIME_SPAN',
-        'MALI_CONFIG_EXT_BUS_BYTE_SIZE'
-    )
-
-    # Manually reviewed exceptions
-    exceptions = set((
-        'MaliFragOverdraw',
-        'MaliSCBusTileWrBPerPx'
-    ))
+    # Domains of counters used by expressions, indexed by machine name
+    var_domains: dict[str, Domain] = {}
 
     # Test every expression in the counter database
     for counter in cnt_db:
@@ -887,7 +918,7 @@ def validate_derived_equation_cardinality(gpu: str) -> int:
             continue
 
         # Skip exceptions that are already approved
-        if counter.machine_name in exceptions:
+        if counter.machine_name in CARDINALITY_EXCEPTIONS:
             continue
 
         # Find all used domains and scaling constants
@@ -898,22 +929,27 @@ def validate_derived_equation_cardinality(gpu: str) -> int:
             var_name = str(node.children[0])
 
             # Other constants and intermediate nodes we can ignore
-            if (var_name in other_constants) or ('(' in var_name):
+            if (var_name in CARDINALITY_OTHER_CONSTANTS) or ('(' in var_name):
                 continue
 
             # Detect constant scaling factors
-            if var_name in scaling_constants:
-                scale_use.add(scaling_constants[var_name])
+            if var_name in CARDINALITY_SCALING_CONSTANTS:
+                scale_use.add(CARDINALITY_SCALING_CONSTANTS[var_name])
                 continue
 
             # Detect real counter, which we know must exist
-            var_counter = cnt_db.get_by_machine_name(var_name)
-            assert var_counter is not None
+            domain = var_domains.get(var_name)
+            if domain is None:
+                var_counter = cnt_db.get_by_machine_name(var_name)
+                assert var_counter is not None
 
-            index = var_counter.block_type
-            assert index is not None
+                index = var_counter.block_type
+                assert index is not None
 
-            domain_use.add(domains[index])
+                domain = CARDINALITY_DOMAINS[index]
+                var_domains[var_name] = domain
+
+            domain_use.add(domain)
 
         # Nothing to check if expression only uses a single domain
         if len(domain_use) <= 1:
@@ -926,7 +962,7 @@ def validate_derived_equation_cardinality(gpu: str) -> int:
                 continue
 
             if domain not in scale_use:
-                reason = f'Missing cardinality scaling for {domain.value}'
+                reason = f'Missing cardinality scaling for {domain.name}'
                 print_err_gc(reason, gpu, counter.machine_name)
                 errors += 1
 
@@ -948,15 +984,14 @@ def validate_string_resolve(cnt_db: IndexedView, gpu: str, cname: str,
     Returns:
         The number of errors discovered.
     '''
-    pattern = re.compile('{{(.*?)}}')
-
-    valid_constants = ('GPU_NAME', )
-    valid_parts = ('', 'equation')
+    # Most strings have no references, so skip the pattern scan
+    if '{{' not in docs:
+        return 0
 
     errors = 0
 
     # Check all matches
-    for match in pattern.finditer(docs):
+    for match in REFERENCE_PATTERN.finditer(docs):
         matched = match.group(1)
 
         # Validate reference pattern is legal
@@ -966,7 +1001,7 @@ def validate_string_resolve(cnt_db: IndexedView, gpu: str, cname: str,
 
         # Validate literal constants
         if ref_type == 'K':
-            if ref_name not in valid_constants:
+            if ref_name not in VALID_REFERENCE_CONSTANTS:
                 reason = f'Bad reference constant for {source} {matched}'
                 print_err_gc(reason, gpu, cname)
                 errors += 1
@@ -978,7 +1013,7 @@ def validate_string_resolve(cnt_db: IndexedView, gpu: str, cname: str,
 
         # Validate counter references
         elif ref_type == 'C':
-            if ref_part not in valid_parts:
+            if ref_part not in VALID_REFERENCE_PARTS:
                 reason = f'Bad doc reference postfix for {source} {matched}'
                 print_err_gc(reason, gpu, cname)
                 errors += 1
@@ -998,18 +1033,18 @@ def validate_string_resolve(cnt_db: IndexedView, gpu: str, cname: str,
     return errors
 
 
-def validate_counter_documentation_resolve(gpu: str) -> int:
+def validate_counter_documentation_resolve(cnt_db: IndexedView,
+                                           gpu: str) -> int:
     '''
     Validate documentation references can resolve.
 
     Args:
+        cnt_db: Indexed view of the GPU to check.
         gpu: GPU database key to check.
 
     Returns:
         The number of errors discovered.
     '''
-    cnt_db = CounterDatabase.get_indexed_view_for(gpu)
-
     errors = 0
 
     # Check counter documentation
@@ -1022,17 +1057,18 @@ def validate_counter_documentation_resolve(gpu: str) -> int:
     return errors
 
 
-def validate_semantic_documentation_resolve(gpu: str) -> int:
+def validate_semantic_documentation_resolve(cnt_db: IndexedView,
+                                            gpu: str) -> int:
     '''
     Validate documentation references can resolve.
 
     Args:
+        cnt_db: Indexed view of the GPU to check.
         gpu: GPU database key to check.
 
     Returns:
         The number of errors discovered.
     '''
-    cnt_db = CounterDatabase.get_indexed_view_for(gpu)
     sem_db = CounterDatabase.get_semantic_view_for(gpu)
 
     errors = 0
@@ -1054,6 +1090,40 @@ def validate_semantic_documentation_resolve(gpu: str) -> int:
     return errors
 
 
+# Validators run once on the full database, in order
+DATABASE_VALIDATORS = (
+    validate_whitespace, validate_absence_of_resolves,
+    validate_vulkan_string_lengths, validate_stable_ids, validate_gpu_fields,
+    validate_units_fields, validate_derived_equation_fields,
+    validate_semantic_layout, validate_semantic_info)
+
+
+def validate_gpu(gpu: str) -> tuple[int, str]:
+    '''
+    Run all validation that is specific to a single GPU.
+
+    Error reports are captured so parallel results print in a stable order.
+
+    Args:
+        gpu: GPU database key to check.
+
+    Returns:
+        The number of errors discovered, and the error report text.
+    '''
+    cnt_db = CounterDatabase.get_indexed_view_for(gpu)
+    report = io.StringIO()
+
+    with contextlib.redirect_stdout(report):
+        errors = validate_name_uniqueness(gpu)
+        errors += validate_source_name_consistency(cnt_db, gpu)
+        errors += validate_derived_equation_resolve(cnt_db, gpu)
+        errors += validate_derived_equation_cardinality(cnt_db, gpu)
+        errors += validate_counter_documentation_resolve(cnt_db, gpu)
+        errors += validate_semantic_documentation_resolve(cnt_db, gpu)
+
+    return errors, report.getvalue()
+
+
 def parse_cli():
     '''
     Parse the command line.
@@ -1067,6 +1137,10 @@ def parse_cli():
         '--overwrite', action='store_true', default=False,
         help='overwrite database files to apply suggested edits')
 
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=os.cpu_count() or 1,
+        help='number of GPUs to validate in parallel')
+
     args = parser.parse_args()
     return args
 
@@ -1085,23 +1159,18 @@ def main():
     database_keys = CounterDatabase.get_supported_database_keys()
 
     # Validation on the full database
-    errors += validate_whitespace()
-    errors += validate_absence_of_resolves()
-    errors += validate_vulkan_string_lengths()
-    errors += validate_stable_ids()
-    errors += validate_gpu_fields()
-    errors += validate_units_fields()
-    errors += validate_derived_equation_fields()
-    errors += validate_semantic_layout()
-    errors += validate_semantic_info()
-
-    for gpu in database_keys:
-        errors += validate_name_uniqueness(gpu)
-        errors += validate_source_name_consistency(gpu)
-        errors += validate_derived_equation_resolve(gpu)
-        errors += validate_derived_equation_cardinality(gpu)
-        errors += validate_counter_documentation_resolve(gpu)
-        errors += validate_semantic_documentation_resolve(gpu)
+    errors += sum(validator() for validator in DATABASE_VALIDATORS)
+
+    # Validation per GPU, which shares no state across GPUs
+    if args.jobs > 1 and len(database_keys) > 1:
+        with ProcessPoolExecutor(min(args.jobs, len(database_keys))) as pool:
+            results = list(pool.map(validate_gpu, database_keys))
+    else:
+        results = [validate_gpu(gpu) for gpu in database_keys]
+
+    for gpu_errors, report in results:
+        print(report, end='')
+        errors += gpu_errors
 
     # Pretty print everything
     if args.overwrite: